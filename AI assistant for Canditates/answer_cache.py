@@ -0,0 +1,146 @@
+import os
+import threading
+import time
+
+import numpy as np
+
+
+# ---------------------------
+# Semantic answer cache
+# ---------------------------
+# Candidates ask the same few questions in slightly different words. The
+# question is embedded and compared (cosine) with earlier questions; above
+# ANSWER_CACHE_THRESHOLD the earlier answer is returned without touching the
+# retriever or the LLM. Entries belong to one index version and are dropped
+# when the policy documents change. Least recently used entries are evicted
+# once ANSWER_CACHE_SIZE is reached.
+
+ANSWER_CACHE_THRESHOLD = float(os.getenv("ANSWER_CACHE_THRESHOLD", "0.92"))
+ANSWER_CACHE_SIZE = int(os.getenv("ANSWER_CACHE_SIZE", "1000"))
+
+
+def _normalize(text):
+    return " ".join(text.lower().split())
+
+
+class SemanticAnswerCache:
+    def __init__(self, embeddings, threshold=ANSWER_CACHE_THRESHOLD, max_entries=ANSWER_CACHE_SIZE):
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.version = None
+        self._lock = threading.Lock()
+        self._clock = 0
+        self._reset()
+
+        self.hits = 0
+        self.misses = 0
+        self.hit_ms = 0.0
+        self.miss_ms = 0.0
+
+    def _reset(self):
+        self._vectors = None  # (max_entries, dim) float32, unit rows
+        self._answers = []
+        self._questions = {}  # normalized text -> row
+        self._last_used = np.zeros(self.max_entries, dtype=np.int64)
+
+    def set_version(self, version):
+        """Tie entries to an index version; a different version empties the cache."""
+        with self._lock:
+            if version != self.version:
+                if self._answers:
+                    print(f"[Answer cache] Index changed ({self.version} -> {version}), cleared")
+                self._reset()
+                self.version = version
+
+    def _embed(self, question):
+        vec = np.asarray(self.embeddings.embed_query(question), dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def _lookup(self, key, vec):
+        """(row, similarity) of the closest cached question above threshold, else (None, best)."""
+        if key in self._questions:
+            return self._questions[key], 1.0
+        if vec is None or not self._answers:
+            return None, 0.0
+        sims = self._vectors[:len(self._answers)] @ vec
+        row = int(np.argmax(sims))
+        if sims[row] >= self.threshold:
+            return row, float(sims[row])
+        return None, float(sims[row])
+
+    def _store(self, key, vec, answer):
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_entries, vec.shape[0]), dtype=np.float32)
+
+        if len(self._answers) < self.max_entries:
+            row = len(self._answers)
+            self._answers.append(answer)
+        else:
+            row = int(np.argmin(self._last_used))
+            self._answers[row] = answer
+            self._questions = {k: r for k, r in self._questions.items() if r != row}
+
+        self._vectors[row] = vec
+        self._questions[key] = row
+        self._touch(row)
+
+    def _touch(self, row):
+        self._clock += 1
+        self._last_used[row] = self._clock
+
+    def answer(self, question, compute):
+        """Cached answer for question, or compute(question) stored for next time."""
+        start = time.perf_counter()
+        key = _normalize(question)
+
+        with self._lock:
+            row, sim = self._lookup(key, None)
+        vec = None
+        if row is None:
+            vec = self._embed(question)
+            with self._lock:
+                row, sim = self._lookup(key, vec)
+
+        if row is not None:
+            with self._lock:
+                self._touch(row)
+                answer = self._answers[row]
+                self.hits += 1
+                self.hit_ms += (time.perf_counter() - start) * 1000
+            self._report("hit", sim, start)
+            return answer
+
+        version = self.version
+        answer = compute(question)
+        with self._lock:
+            # Skip storing if the index changed while the LLM was answering
+            if version == self.version:
+                self._store(key, vec, answer)
+            self.misses += 1
+            self.miss_ms += (time.perf_counter() - start) * 1000
+        self._report("miss", sim, start)
+        return answer
+
+    def _report(self, outcome, sim, start):
+        ms = (time.perf_counter() - start) * 1000
+        s = self.stats()
+        means = ", ".join(
+            f"mean {k} {s[f'mean_{k}_ms']}ms" for k in ("hit", "miss") if s[f"mean_{k}_ms"] is not None
+        )
+        print(
+            f"[Answer cache] {outcome} (closest {sim:.3f}) in {ms:.0f}ms | "
+            f"hit rate {s['hit_rate']} over {s['hits'] + s['misses']}, {means}"
+        )
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._answers),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else None,
+            "mean_hit_ms": round(self.hit_ms / self.hits, 1) if self.hits else None,
+            "mean_miss_ms": round(self.miss_ms / self.misses, 1) if self.misses else None,
+        }
@@ -1,14 +1,17 @@
 import os
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
 import gradio as gr
 
 # Vector store + embeddings + document loaders
-from langchain_community.document_loaders import DirectoryLoader, PyPDFLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_community.vectorstores import Chroma
 from langchain_huggingface import HuggingFaceEmbeddings
+from answer_cache import SemanticAnswerCache
+from embedding_cache import CachedEmbeddings
+from vector_index import open_vectorstore, sync_index
 
 # FREE Gemini API
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -31,52 +34,38 @@ if not GOOGLE_API_KEY:
 
 DATA_DIR = Path("data/company_policies")
 CHROMA_DIR = "chroma_db"
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_CACHE = "embedding_cache.sqlite"
+
+# How often a question first re-syncs the index with DATA_DIR, so policy
+# PDFs added / changed while the app runs are picked up
+INDEX_REFRESH_SECONDS = float(os.getenv("INDEX_REFRESH_SECONDS", "300"))
 
 
 # ---------------------------
-# Build Vector DB
+# Vector DB (incremental: only new / changed PDFs are embedded)
 # ---------------------------
 
-def build_vectorstore():
-    loader = DirectoryLoader(
-        str(DATA_DIR),
-        glob="*.pdf",
-        loader_cls=PyPDFLoader
-    )
-    docs = loader.load()
-
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=500,
-        chunk_overlap=100
-    )
-    chunks = splitter.split_documents(docs)
-
-    embeddings = HuggingFaceEmbeddings(
-        model_name="sentence-transformers/all-MiniLM-L6-v2"
-    )
-
-    vectordb = Chroma.from_documents(
-        chunks,
-        embedding=embeddings,
-        persist_directory=CHROMA_DIR
+@lru_cache(maxsize=None)
+def get_embeddings():
+    # One model instance for indexing and retrieval, behind the chunk cache
+    return CachedEmbeddings(
+        HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL),
+        EMBEDDING_MODEL,
+        EMBEDDING_CACHE
     )
-    return vectordb
 
 
-def load_vectorstore():
-    embeddings = HuggingFaceEmbeddings(
-        model_name="sentence-transformers/all-MiniLM-L6-v2"
-    )
-    return Chroma(
-        persist_directory=CHROMA_DIR,
-        embedding_function=embeddings
-    )
+def sync_vectorstore(vectordb):
+    """Index added / changed PDFs, drop removed ones; returns the index version."""
+    report = sync_index(vectordb, DATA_DIR, CHROMA_DIR)
+    print(f"[Embedding cache] {get_embeddings().stats()}")
+    return report["version"]
 
 
 def get_vectorstore():
-    if os.path.exists(CHROMA_DIR) and os.listdir(CHROMA_DIR):
-        return load_vectorstore()
-    return build_vectorstore()
+    vectordb = open_vectorstore(get_embeddings(), CHROMA_DIR)
+    return vectordb, sync_vectorstore(vectordb)
 
 
 # ---------------------------
@@ -129,11 +118,27 @@ def create_rag_pipeline(vectordb):
 
 def create_chatbot():
 
-    vectordb = get_vectorstore()
+    vectordb, index_version = get_vectorstore()
     rag = create_rag_pipeline(vectordb)
 
+    # Repeated / reworded questions skip retrieval and the LLM
+    answers = SemanticAnswerCache(get_embeddings())
+    answers.set_version(index_version)
+
+    sync_lock = threading.Lock()
+    last_sync = time.monotonic()
+
+    def refresh_index():
+        # A new version (documents changed) empties the answer cache
+        nonlocal last_sync
+        with sync_lock:
+            if time.monotonic() - last_sync >= INDEX_REFRESH_SECONDS:
+                answers.set_version(sync_vectorstore(vectordb))
+                last_sync = time.monotonic()
+
     def chat_fn(message, history):
-        response = rag.invoke(message)
+        refresh_index()
+        response = answers.answer(message, rag.invoke)
         return response
 
     return gr.ChatInterface(
@@ -0,0 +1,79 @@
+import hashlib
+import sqlite3
+import threading
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+# ---------------------------
+# Persistent chunk-embedding cache
+# ---------------------------
+# Wraps an Embeddings model. Document embeddings are stored in SQLite under
+# sha256(model name + text), so rebuilding the index, re-adding a changed
+# PDF or indexing documents that share boilerplate only sends text the
+# model has never seen. Queries are passed straight through.
+
+class CachedEmbeddings(Embeddings):
+    def __init__(self, underlying, model_name, path="embedding_cache.sqlite"):
+        self.underlying = underlying
+        self.model_name = model_name
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)")
+
+    def _key(self, text):
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def _lookup(self, keys):
+        found = {}
+        keys = list(keys)
+        with self._lock:
+            for i in range(0, len(keys), 500):  # SQLite bound-parameter limit
+                batch = keys[i:i + 500]
+                rows = self._db.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})", batch
+                )
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def _store(self, items):
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, np.asarray(vec, dtype=np.float32).tobytes()) for key, vec in items],
+            )
+
+    def embed_documents(self, texts):
+        keys = [self._key(t) for t in texts]
+        found = self._lookup(set(keys))
+
+        # Unseen texts, each embedded once even if repeated within the batch
+        todo = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in todo:
+                todo[key] = text
+
+        if todo:
+            vectors = self.underlying.embed_documents(list(todo.values()))
+            new = dict(zip(todo.keys(), vectors))
+            self._store(new.items())
+            found.update(new)
+
+        self.misses += len(todo)
+        self.hits += len(texts) - len(todo)
+        return [found[k] for k in keys]
+
+    def embed_query(self, text):
+        return self.underlying.embed_query(text)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else None,
+        }
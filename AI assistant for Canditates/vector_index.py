@@ -0,0 +1,239 @@
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from langchain_community.vectorstores import Chroma
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from pypdf import PdfReader
+
+
+# ---------------------------
+# Incremental indexing
+# ---------------------------
+# Each policy PDF is tracked by content hash in a manifest next to the
+# Chroma files. On startup only added / changed PDFs are chunked and
+# embedded, and chunks of changed / removed PDFs are deleted by id.
+#
+# PDFs are read and split in a process pool, a page range per task, so a
+# long manual never has all its pages in memory and several files split
+# at once. Chunks are embedded in batches of EMBED_BATCH as tasks finish,
+# in page order, so chunk ids match a serial run.
+
+MANIFEST_NAME = "index_manifest.json"
+CHUNK_SIZE = 500
+CHUNK_OVERLAP = 100
+
+INDEX_WORKERS = int(os.getenv("INDEX_WORKERS", str(min(4, os.cpu_count() or 1))))
+PAGES_PER_TASK = int(os.getenv("INDEX_PAGES_PER_TASK", "16"))
+EMBED_BATCH = int(os.getenv("INDEX_EMBED_BATCH", "64"))
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def chunk_ids(name, content_hash, count, start=0):
+    # Deterministic, so a file's chunks can be deleted without querying Chroma
+    return [f"{name}:{content_hash[:16]}:{i}" for i in range(start, start + count)]
+
+
+def _manifest_path(chroma_dir):
+    return Path(chroma_dir) / MANIFEST_NAME
+
+
+def load_manifest(chroma_dir):
+    try:
+        with open(_manifest_path(chroma_dir), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"version": None, "files": {}}
+
+
+def save_manifest(chroma_dir, manifest):
+    path = _manifest_path(chroma_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, path)
+
+
+def open_vectorstore(embeddings, chroma_dir):
+    vectordb = Chroma(persist_directory=chroma_dir, embedding_function=embeddings)
+
+    if not _manifest_path(chroma_dir).exists() and vectordb._collection.count() > 0:
+        # Built before incremental indexing: chunk ids are unknown, start over once
+        print("[Index] No manifest for existing store, rebuilding it")
+        vectordb.delete_collection()
+        vectordb = Chroma(persist_directory=chroma_dir, embedding_function=embeddings)
+    return vectordb
+
+
+# ---------------------------
+# Parallel load + split
+# ---------------------------
+
+def split_pages(path, start, stop, content_hash):
+    """Chunks of pages [start, stop) of one PDF; runs in a worker process."""
+    reader = PdfReader(path)
+    total = len(reader.pages)
+    docs = [
+        Document(
+            page_content=reader.pages[i].extract_text() or "",
+            metadata={"source": str(path), "total_pages": total, "page": i, "page_label": str(i + 1)},
+        )
+        for i in range(start, min(stop, total))
+    ]
+    splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+    chunks = splitter.split_documents(docs)
+
+    texts = [c.page_content for c in chunks]
+    metadatas = [{**c.metadata, "content_hash": content_hash} for c in chunks]
+    return texts, metadatas
+
+
+def page_tasks(files):
+    """files: [(name, path, content_hash)] -> [(name, path, start, stop, content_hash)]"""
+    tasks = []
+    for name, path, content_hash in files:
+        pages = len(PdfReader(path).pages)
+        for start in range(0, pages, PAGES_PER_TASK):
+            tasks.append((name, str(path), start, start + PAGES_PER_TASK, content_hash))
+    return tasks
+
+
+def iter_split(tasks, workers=None):
+    """Yield (name, texts, metadatas) per task, in task order."""
+    workers = INDEX_WORKERS if workers is None else workers
+    if workers <= 1 or len(tasks) <= 1:
+        for name, *args in tasks:
+            yield (name, *split_pages(*args))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # A bounded window of tasks in flight, so finished chunks don't pile up
+        pending = deque()
+        todo = iter(tasks)
+
+        def submit_next():
+            task = next(todo, None)
+            if task:
+                name, *args = task
+                pending.append((name, pool.submit(split_pages, *args)))
+
+        for _ in range(workers * 2):
+            submit_next()
+        while pending:
+            name, fut = pending.popleft()
+            submit_next()
+            yield (name, *fut.result())
+
+
+def index_files(vectordb, files, workers=None):
+    """
+    Split files across the pool and add their chunks in EMBED_BATCH batches.
+    Returns {name: {"chunks", "index_seconds"}}.
+
+    index_seconds is wall-clock time: each stretch of this loop is charged
+    to the file it was waiting on (a split task's result, or its chunks'
+    share of an embedding batch), so the files' times add up to the elapsed
+    time of the run rather than to the workers' combined time.
+    """
+    stats = {name: {"chunks": 0, "index_seconds": 0.0} for name, _, _ in files}
+    hashes = {name: content_hash for name, _, content_hash in files}
+    batch = []  # (name, text, metadata, id)
+    last = time.perf_counter()
+
+    def flush():
+        nonlocal last
+        if not batch:
+            return
+        vectordb.add_texts(
+            [b[1] for b in batch], metadatas=[b[2] for b in batch], ids=[b[3] for b in batch]
+        )
+        now = time.perf_counter()
+        per_chunk = (now - last) / len(batch)
+        for name, *_ in batch:
+            stats[name]["index_seconds"] += per_chunk
+        last = now
+        batch.clear()
+
+    for name, texts, metadatas in iter_split(page_tasks(files), workers):
+        now = time.perf_counter()
+        stats[name]["index_seconds"] += now - last
+        last = now
+
+        first = stats[name]["chunks"]
+        ids = chunk_ids(name, hashes[name], len(texts), start=first)
+        stats[name]["chunks"] += len(texts)
+        batch.extend(zip([name] * len(texts), texts, metadatas, ids))
+        if len(batch) >= EMBED_BATCH:
+            flush()
+    flush()
+
+    for s in stats.values():
+        s["index_seconds"] = round(s["index_seconds"], 3)
+    return stats
+
+
+def sync_index(vectordb, data_dir, chroma_dir):
+    """Bring the store in line with the PDFs in data_dir; returns a report dict."""
+    start = time.perf_counter()
+    manifest = load_manifest(chroma_dir)
+    indexed = manifest["files"]
+
+    current = {p.name: p for p in sorted(Path(data_dir).glob("*.pdf"))}
+    hashes = {name: file_sha256(p) for name, p in current.items()}
+
+    added = [n for n in current if n not in indexed]
+    changed = [n for n in current if n in indexed and indexed[n]["sha256"] != hashes[n]]
+    removed = [n for n in indexed if n not in current]
+    unchanged = len(current) - len(added) - len(changed)
+
+    chunks_deleted = 0
+    for name in removed + changed:
+        old = indexed.pop(name)
+        ids = chunk_ids(name, old["sha256"], old["chunks"])
+        if ids:
+            vectordb.delete(ids=ids)
+        chunks_deleted += len(ids)
+
+    stats = index_files(vectordb, [(n, current[n], hashes[n]) for n in added + changed])
+    chunks_added = 0
+    for name, s in stats.items():
+        chunks_added += s["chunks"]
+        indexed[name] = {"sha256": hashes[name], **s}
+
+    # Changes whenever the indexed corpus does (answer caches key on this)
+    manifest["version"] = hashlib.sha256(
+        json.dumps({n: f["sha256"] for n, f in indexed.items()}, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:16]
+    save_manifest(chroma_dir, manifest)
+
+    report = {
+        "added": len(added),
+        "changed": len(changed),
+        "removed": len(removed),
+        "unchanged": unchanged,
+        "chunks_added": chunks_added,
+        "chunks_deleted": chunks_deleted,
+        "seconds": round(time.perf_counter() - start, 2),
+        # What re-embedding everything would cost, from each file's last index time
+        "full_rebuild_seconds": round(sum(f["index_seconds"] for f in indexed.values()), 2),
+        "version": manifest["version"],
+    }
+    print(
+        f"[Index] {report['added']} added, {report['changed']} changed, {report['removed']} removed, "
+        f"{report['unchanged']} unchanged: {chunks_added} chunks embedded, {chunks_deleted} deleted "
+        f"in {report['seconds']}s (full rebuild ~{report['full_rebuild_seconds']}s)"
+    )
+    return report
@@ -0,0 +1,152 @@
+"""
+bench_generic_parser.py
+Micro-benchmark of the single-pass generic_parser against the previous
+six-pass implementation, checking that both give identical output.
+
+    python bench_generic_parser.py              # synthetic corpus built from sample texts
+    python bench_generic_parser.py ocr_texts/   # directory of .txt OCR outputs
+"""
+
+import os
+import random
+import re
+import sys
+import timeit
+from typing import Dict
+
+from generic_parser import parse_generic_certificate
+from parse_certificate import raw_text as NPTEL_SAMPLE
+
+COURSERA_SAMPLE = """
+coursera
+Jan 12, 2024
+JOHN DOE
+has successfully completed
+Machine Learning
+an online non-credit course authorized by Stanford University and offered through Coursera
+Verify at coursera.org/verify/ABCD1234EFGH
+"""
+
+GENERIC_SAMPLE = """
+CERTIFICATE OF ACHIEVEMENT
+This is to certify that
+Priya Sharma
+has completed course entitled
+Advanced Data Structures
+Score: 88 %
+Cert No: ACME2024000123
+Issued Mar-Apr 2024
+"""
+
+NOISE = ["", "~~ ||", "Signature", "www.example.org", "Page 1 of 1", "Director", "Seal"]
+
+
+def parse_generic_certificate_legacy(text: str) -> Dict:
+    """Previous six-pass implementation, kept as the reference output."""
+    lines = [l.strip() for l in text.splitlines() if l.strip()]
+
+    data = {
+        "student_name": None,
+        "course_title": None,
+        "score_percent": None,
+        "issue_info": None,
+        "roll_or_id": None,
+        "provider_guess": None,
+    }
+
+    # Provider: first line with CERTIFICATION/CERTIFICATE/ONLINE
+    for line in lines[:5]:
+        if any(word in line.upper() for word in ["CERTIFICATION", "CERTIFICATE", "ONLINE"]):
+            data["provider_guess"] = line
+            break
+
+    # Name: line IMMEDIATELY AFTER "awarded to" / "presented to" / "certify"
+    award_phrases = ["awarded to", "presented to", "certify that", "certificate is awarded"]
+    for i, line in enumerate(lines):
+        if any(phrase in line.lower() for phrase in award_phrases):
+            if i + 1 < len(lines):
+                candidate = lines[i + 1].strip()
+                if candidate and len(candidate.split()) >= 2:  # Full name
+                    data["student_name"] = candidate
+            break
+
+    # Course: line IMMEDIATELY AFTER "completing the course" / "completed course"
+    course_phrases = ["completing the course", "completed course", "course entitled"]
+    for i, line in enumerate(lines):
+        if any(phrase in line.lower() for phrase in course_phrases):
+            if i + 1 < len(lines):
+                candidate = lines[i + 1].strip()
+                if candidate and len(candidate.split()) >= 2:  # Course title
+                    data["course_title"] = candidate
+            break
+
+    # Score: any line with "%"
+    for line in lines:
+        if "%" in line:
+            m = re.search(r"(\d{1,3})\s*%", line)
+            if m:
+                data["score_percent"] = int(m.group(1))
+                break
+
+    # ID: "Roll No:", "ID:", "Certificate No:"
+    for line in lines:
+        if re.search(r"(Roll No|Roll Number|ID|Cert No)\s*[:\-]?", line, re.IGNORECASE):
+            m = re.search(r"([A-Z0-9]{10,})", line)
+            if m:
+                data["roll_or_id"] = m.group(1)
+                break
+
+    # Session/Date: line with "MMM-MMM YYYY" pattern
+    for line in lines:
+        if re.search(r"[A-Z][a-z]{2}-[A-Z][a-z]{2}\s+\d{4}", line):
+            data["issue_info"] = line
+            break
+
+    return data
+
+
+def build_corpus(n=500, seed=7):
+    rng = random.Random(seed)
+    samples = [NPTEL_SAMPLE, COURSERA_SAMPLE, GENERIC_SAMPLE]
+    corpus = []
+    for _ in range(n):
+        lines = rng.choice(samples).splitlines()
+        # OCR-like noise: stray lines and dropped lines
+        for _ in range(rng.randint(0, 6)):
+            lines.insert(rng.randrange(len(lines) + 1), rng.choice(NOISE))
+        if rng.random() < 0.2:
+            del lines[rng.randrange(len(lines))]
+        corpus.append("\n".join(lines))
+    return corpus
+
+
+def load_corpus(path):
+    texts = []
+    for name in sorted(os.listdir(path)):
+        if name.endswith(".txt"):
+            with open(os.path.join(path, name), encoding="utf-8", errors="ignore") as f:
+                texts.append(f.read())
+    return texts
+
+
+def main():
+    corpus = load_corpus(sys.argv[1]) if len(sys.argv) > 1 else build_corpus()
+
+    mismatches = sum(
+        parse_generic_certificate(t) != parse_generic_certificate_legacy(t) for t in corpus
+    )
+    print(f"Corpus: {len(corpus)} texts, output mismatches: {mismatches}")
+
+    def run(fn):
+        return min(timeit.repeat(lambda: [fn(t) for t in corpus], number=5, repeat=5)) / 5
+
+    legacy = run(parse_generic_certificate_legacy)
+    single = run(parse_generic_certificate)
+    per_text = 1e6 / len(corpus)
+    print(f"legacy (6 passes): {legacy * per_text:8.1f} us/text")
+    print(f"single pass      : {single * per_text:8.1f} us/text")
+    print(f"speedup          : {legacy / single:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+bench_ocr.py
+Per-image OCR latency for each available engine on a batch of certificates.
+
+    python bench_ocr.py                     # images from test_all_certificates.TEST_CASES
+    python bench_ocr.py certs/ a.jpg b.png  # files and/or directories
+"""
+
+import os
+import statistics
+import sys
+import time
+
+from PIL import Image
+
+import ocr_service  # sets the tesseract path used by the subprocess engine
+from ocr_engine import TesserocrEngine, SubprocessEngine
+
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp")
+
+
+def collect_images(args):
+    if not args:
+        from test_all_certificates import TEST_CASES
+        return [case[0] for case in TEST_CASES]
+
+    paths = []
+    for a in args:
+        if os.path.isdir(a):
+            paths += sorted(
+                os.path.join(a, f) for f in os.listdir(a) if f.lower().endswith(IMAGE_EXTS)
+            )
+        else:
+            paths.append(a)
+    return paths
+
+
+def bench_engine(engine, images):
+    engine.image_to_string(images[0])  # warm-up: worker start / language data load
+
+    timings = []
+    for img in images:
+        start = time.perf_counter()
+        engine.image_to_string(img)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    paths = collect_images(sys.argv[1:])
+    images = []
+    for p in paths:
+        img = Image.open(p)
+        img.load()
+        images.append(img)
+
+    if not images:
+        print("No images found.")
+        return
+
+    print(f"Benchmarking OCR on {len(images)} images\n")
+    print(f"{'engine':<12} {'mean ms':>9} {'median ms':>10} {'p95 ms':>9} {'total s':>9}")
+
+    for factory in (TesserocrEngine, SubprocessEngine):
+        try:
+            engine = factory()
+        except Exception as e:
+            print(f"{factory.name:<12} unavailable: {e}")
+            continue
+
+        t = sorted(bench_engine(engine, images))
+        p95 = t[min(len(t) - 1, int(len(t) * 0.95))]
+        print(f"{engine.name:<12} {statistics.mean(t):>9.1f} {statistics.median(t):>10.1f} "
+              f"{p95:>9.1f} {sum(t) / 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+bench_phash_index.py
+Near-duplicate lookup latency of phash_index.HashIndex over a large store.
+
+    python bench_phash_index.py [store_size] [queries]
+"""
+
+import random
+import sys
+import time
+
+from phash_index import HashIndex
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    n_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    rng = random.Random(42)
+
+    index = HashIndex()
+    hashes = [rng.getrandbits(64) for _ in range(size)]
+    start = time.perf_counter()
+    for i, h in enumerate(hashes):
+        index.add(h, image=f"cert_{i}.jpg")
+    build_s = time.perf_counter() - start
+
+    # Half the queries are edited copies (a few flipped bits), half unseen images
+    queries = []
+    for i in range(n_queries):
+        if i % 2 == 0:
+            h = rng.choice(hashes)
+            for bit in rng.sample(range(64), rng.randint(0, index.max_distance)):
+                h ^= 1 << bit
+        else:
+            h = rng.getrandbits(64)
+        queries.append(h)
+
+    start = time.perf_counter()
+    found = sum(1 for q in queries if index.query(q))
+    query_s = time.perf_counter() - start
+
+    print(f"Store size   : {len(index)}")
+    print(f"Build        : {build_s:.2f}s")
+    print(f"Queries      : {n_queries} ({found} with a near-duplicate)")
+    print(f"Avg lookup   : {query_s / n_queries * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
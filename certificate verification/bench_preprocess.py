@@ -0,0 +1,76 @@
+"""
+bench_preprocess.py
+Timing and OCR accuracy of each preprocessing profile on a certificate fixture set.
+
+    python bench_preprocess.py                 # cases from test_all_certificates.TEST_CASES
+    python bench_preprocess.py cases.json      # [[image_path, expected_name, expected_course], ...]
+"""
+
+import json
+import os
+import statistics
+import sys
+import time
+from difflib import SequenceMatcher
+
+# Measure preprocessing + OCR, not cache hits (set before ocr_cache is imported)
+os.environ["OCR_CACHE_MAX_MB"] = "0"
+
+from certificate_pipeline import process_certificate
+from preprocess import PROFILES
+
+
+def similarity(a, b):
+    return SequenceMatcher(None, (a or "").strip().lower(), (b or "").strip().lower()).ratio()
+
+
+def load_cases(args):
+    if args:
+        with open(args[0], encoding="utf-8") as f:
+            return json.load(f)
+    from test_all_certificates import TEST_CASES
+    return TEST_CASES
+
+
+def bench_profile(profile, cases):
+    totals, preprocess_ms, ocr_ms = [], [], []
+    exact, fuzzy = 0, []
+
+    for image_path, expected_name, expected_course in cases:
+        timings = {}
+        start = time.perf_counter()
+        # Full-page OCR whatever CERT_OCR_MODE says; PDFs with a text layer
+        # skip OCR and count as 0 ms
+        parsed = process_certificate(image_path, profile=profile, timings=timings, mode="full")
+        totals.append((time.perf_counter() - start) * 1000)
+        preprocess_ms.append(sum(timings.get("preprocess", {}).values()))
+        ocr_ms.append(timings.get("ocr_ms", 0.0))
+
+        name_sim = similarity(parsed.get("student_name"), expected_name)
+        course_sim = similarity(parsed.get("course_title"), expected_course)
+        exact += name_sim == 1.0 and course_sim == 1.0
+        fuzzy.append((name_sim + course_sim) / 2)
+
+    return {
+        "profile": profile,
+        "preprocess_ms": statistics.mean(preprocess_ms),
+        "ocr_ms": statistics.mean(ocr_ms),
+        "total_ms": statistics.mean(totals),
+        "exact": exact,
+        "field_similarity": statistics.mean(fuzzy),
+    }
+
+
+def main():
+    cases = load_cases(sys.argv[1:])
+    print(f"Benchmarking {len(PROFILES)} profiles on {len(cases)} certificates\n")
+    print(f"{'profile':<10} {'prep ms':>9} {'ocr ms':>9} {'total ms':>9} {'exact':>7} {'similarity':>11}")
+
+    for profile in PROFILES:
+        r = bench_profile(profile, cases)
+        print(f"{r['profile']:<10} {r['preprocess_ms']:>9.1f} {r['ocr_ms']:>9.1f} {r['total_ms']:>9.1f} "
+              f"{r['exact']:>3}/{len(cases):<3} {r['field_similarity']:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
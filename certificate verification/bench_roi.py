@@ -0,0 +1,56 @@
+"""
+bench_roi.py
+Full-page vs region-of-interest OCR: time per certificate, how often the ROI
+result is used (vs falling back to the full page) and field accuracy.
+
+    python bench_roi.py                 # cases from test_all_certificates.TEST_CASES
+    python bench_roi.py cases.json      # [[image_path, expected_name, expected_course], ...]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+# Measure OCR, not cache hits
+os.environ["OCR_CACHE_MAX_MB"] = "0"
+
+from bench_preprocess import load_cases, similarity
+from certificate_pipeline import process_certificate
+
+
+def bench_mode(mode, cases):
+    totals, fuzzy = [], []
+    roi_used = 0
+
+    for image_path, expected_name, expected_course in cases:
+        start = time.perf_counter()
+        parsed = process_certificate(image_path, mode=mode)
+        totals.append((time.perf_counter() - start) * 1000)
+
+        roi_used += parsed.get("ocr_mode") == "roi"
+        fuzzy.append((similarity(parsed.get("student_name"), expected_name)
+                      + similarity(parsed.get("course_title"), expected_course)) / 2)
+
+    return {
+        "mode": mode,
+        "mean_ms": statistics.mean(totals),
+        "median_ms": statistics.median(totals),
+        "roi_used": roi_used,
+        "field_similarity": statistics.mean(fuzzy),
+    }
+
+
+def main():
+    cases = load_cases(sys.argv[1:])
+    print(f"Benchmarking OCR modes on {len(cases)} certificates\n")
+    print(f"{'mode':<6} {'mean ms':>9} {'median ms':>10} {'roi used':>9} {'similarity':>11}")
+
+    for mode in ("full", "roi"):
+        r = bench_mode(mode, cases)
+        print(f"{r['mode']:<6} {r['mean_ms']:>9.1f} {r['median_ms']:>10.1f} "
+              f"{r['roi_used']:>4}/{len(cases):<4} {r['field_similarity']:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,40 @@
+import os
+import time
+
 from ocr_service import extract_text_from_image
-from generic_parser import parse_generic_certificate
+import pdf_input
+from providers import parse_certificate_text
+import roi
+
+# "full" = OCR the whole page; "roi" = OCR only template field regions,
+# falling back to the whole page when that is not confident enough.
+# PDFs always take the full path (text layer, or rasterized pages).
+OCR_MODE = os.getenv("CERT_OCR_MODE", "full")
+
+def process_certificate(image_path: str, profile=None, timings=None, mode=None) -> dict:
+    mode = mode or OCR_MODE
 
-def process_certificate(image_path: str) -> dict:
-    raw_text = extract_text_from_image(image_path)
-    parsed = parse_generic_certificate(raw_text)
+    if mode == "roi" and not pdf_input.is_pdf(image_path):
+        roi_timings = {}
+        result = roi.ocr_regions(image_path, profile=profile, timings=roi_timings)
+        if timings is not None:
+            timings["roi"] = roi_timings
+        if result is not None:
+            parsed, raw_text, confidence = result
+            if roi.is_confident(parsed, confidence):
+                parsed["raw_text"] = raw_text
+                parsed["ocr_mode"] = "roi"
+                parsed["ocr_confidence"] = round(confidence, 1)
+                return parsed
+
+    raw_text = extract_text_from_image(image_path, profile=profile, timings=timings)
+
+    start = time.perf_counter()
+    parsed = parse_certificate_text(raw_text)
     parsed["raw_text"] = raw_text
+    if mode == "roi":
+        parsed["ocr_mode"] = "full"
+
+    if timings is not None:
+        timings["parse_ms"] = round((time.perf_counter() - start) * 1000, 2)
     return parsed
@@ -1,6 +1,9 @@
+import re
+import time
 from typing import Dict
 from datetime import datetime, timedelta
 from certificate_pipeline import process_certificate
+from phash_index import document_hash, get_index
 
 def verify_claim(parsed: Dict, claimed_name: str, claimed_course: str) -> Dict:
     def norm(s):
@@ -61,10 +64,58 @@ def compute_validity_generic(parsed: Dict, years_valid: int = 3) -> Dict:
     except Exception:
         return {"issue_date": None, "valid_till": None, "is_currently_valid": None}
 
-def handle_uploaded_certificate(image_path: str, claimed_name: str, claimed_course: str) -> Dict:
-    parsed = process_certificate(image_path)
+def check_duplicates(image_path: str, claimed_name: str, source_name: str = None,
+                     student_name: str = None) -> Dict:
+    """
+    Look the image up in the perceptual-hash index, then record it.
+    Flags near-duplicates submitted under a different name.
+    source_name: what to record instead of image_path (e.g. the upload's
+    file name when image_path is a temporary copy).
+    student_name: the name read from the certificate, left out of text-PDF hashes.
+    """
+    def norm(s):
+        return (s or "").strip().lower()
+
+    try:
+        h, kind = document_hash(image_path, student_name)
+    except Exception as e:
+        # e.g. a scanned PDF on a host without poppler: report, don't fail the verification
+        return {"image_hash": None, "matches": [], "reused_by_other_claimant": None, "error": str(e)}
+
+    index = get_index()
+    # Entries written before hashes had a kind are image hashes
+    matches = [m for m in index.query(h) if m.get("kind", "image") == kind]
+
+    # Same person re-uploading the same file: don't grow the index
+    if not any(m["distance"] == 0 and norm(m.get("claimed_name")) == norm(claimed_name) for m in matches):
+        index.add(h, image=source_name or image_path, claimed_name=claimed_name, kind=kind)
+
+    return {
+        "image_hash": f"{h:016x}",
+        "matches": [
+            {k: m.get(k) for k in ("image", "claimed_name", "added", "distance")}
+            for m in matches
+        ],
+        "reused_by_other_claimant": any(
+            norm(m.get("claimed_name")) != norm(claimed_name) for m in matches
+        ),
+    }
+
+def handle_uploaded_certificate(image_path: str, claimed_name: str, claimed_course: str, profile=None, ocr_mode=None,
+                                source_name=None) -> Dict:
+    timings = {}
+    start = time.perf_counter()
+    parsed = process_certificate(image_path, profile=profile, timings=timings, mode=ocr_mode)
+
+    verify_start = time.perf_counter()
     checks = verify_claim(parsed, claimed_name, claimed_course)
     validity = compute_validity_generic(parsed, years_valid=3)
+    timings["verify_ms"] = round((time.perf_counter() - verify_start) * 1000, 2)
+
+    dedupe_start = time.perf_counter()
+    duplicates = check_duplicates(image_path, claimed_name, source_name, parsed.get("student_name"))
+    timings["dedupe_ms"] = round((time.perf_counter() - dedupe_start) * 1000, 2)
+    timings["total_ms"] = round((time.perf_counter() - start) * 1000, 2)
 
     validity_out = {
         "issue_date": validity["issue_date"].strftime("%Y-%m-%d") if validity["issue_date"] else None,
@@ -76,4 +127,6 @@ def handle_uploaded_certificate(image_path: str, claimed_name: str, claimed_cour
         "parsed": parsed,
         "checks": checks,
         "validity": validity_out,
+        "duplicates": duplicates,
+        "timings": timings,
     }
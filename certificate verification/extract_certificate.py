@@ -1,5 +1,6 @@
 from PIL import Image
 import pytesseract
+from ocr_engine import get_engine
 
 # Point to your Tesseract installation
 pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
@@ -7,7 +8,7 @@ pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tessera
 def extract_certificate_text(image_path):
     try:
         img = Image.open(image_path)
-        text = pytesseract.image_to_string(img)
+        text = get_engine().image_to_string(img)
         return text
     except Exception as e:
         return f"Error: {e}"
@@ -1,5 +1,24 @@
 import re
-from typing import Dict
+from typing import Dict, List, Optional
+
+PROVIDER_WORDS = ("CERTIFICATION", "CERTIFICATE", "ONLINE")
+AWARD_PHRASES = ("awarded to", "presented to", "certify that", "certificate is awarded")
+COURSE_PHRASES = ("completing the course", "completed course", "course entitled")
+
+SCORE_RE = re.compile(r"(\d{1,3})\s*%")
+ID_LABEL_RE = re.compile(r"(Roll No|Roll Number|ID|Cert No)\s*[:\-]?", re.IGNORECASE)
+ID_VALUE_RE = re.compile(r"([A-Z0-9]{10,})")
+SESSION_RE = re.compile(r"[A-Z][a-z]{2}-[A-Z][a-z]{2}\s+\d{4}")
+
+
+def _multiword_line_after(lines: List[str], i: int) -> Optional[str]:
+    # Names and course titles have at least two words
+    if i + 1 < len(lines):
+        candidate = lines[i + 1].strip()
+        if candidate and len(candidate.split()) >= 2:
+            return candidate
+    return None
+
 
 def parse_generic_certificate(text: str) -> Dict:
     lines = [l.strip() for l in text.splitlines() if l.strip()]
@@ -13,52 +32,44 @@ def parse_generic_certificate(text: str) -> Dict:
         "provider_guess": None,
     }
 
-    # Provider: first line with CERTIFICATION/CERTIFICATE/ONLINE
-    for line in lines[:5]:
-        if any(word in line.upper() for word in ["CERTIFICATION", "CERTIFICATE", "ONLINE"]):
-            data["provider_guess"] = line
-            break
+    # Only the first award / course phrase counts, even if the next line is rejected
+    name_done = False
+    course_done = False
 
-    # Name: line IMMEDIATELY AFTER "awarded to" / "presented to" / "certify"
-    award_phrases = ["awarded to", "presented to", "certify that", "certificate is awarded"]
+    # Single pass: every field takes the first line that satisfies it
     for i, line in enumerate(lines):
-        if any(phrase in line.lower() for phrase in award_phrases):
-            if i + 1 < len(lines):
-                candidate = lines[i + 1].strip()
-                if candidate and len(candidate.split()) >= 2:  # Full name
-                    data["student_name"] = candidate
-            break
-
-    # Course: line IMMEDIATELY AFTER "completing the course" / "completed course"
-    course_phrases = ["completing the course", "completed course", "course entitled"]
-    for i, line in enumerate(lines):
-        if any(phrase in line.lower() for phrase in course_phrases):
-            if i + 1 < len(lines):
-                candidate = lines[i + 1].strip()
-                if candidate and len(candidate.split()) >= 2:  # Course title
-                    data["course_title"] = candidate
-            break
-
-    # Score: any line with "%"
-    for line in lines:
-        if "%" in line:
-            m = re.search(r"(\d{1,3})\s*%", line)
+        low = line.lower()
+
+        # Provider: first of the top 5 lines with CERTIFICATION/CERTIFICATE/ONLINE
+        if i < 5 and data["provider_guess"] is None:
+            upper = line.upper()
+            if any(word in upper for word in PROVIDER_WORDS):
+                data["provider_guess"] = line
+
+        # Name: line IMMEDIATELY AFTER "awarded to" / "presented to" / "certify"
+        if not name_done and any(phrase in low for phrase in AWARD_PHRASES):
+            data["student_name"] = _multiword_line_after(lines, i)
+            name_done = True
+
+        # Course: line IMMEDIATELY AFTER "completing the course" / "completed course"
+        if not course_done and any(phrase in low for phrase in COURSE_PHRASES):
+            data["course_title"] = _multiword_line_after(lines, i)
+            course_done = True
+
+        # Score: any line with "%"
+        if data["score_percent"] is None and "%" in line:
+            m = SCORE_RE.search(line)
             if m:
                 data["score_percent"] = int(m.group(1))
-                break
 
-    # ID: "Roll No:", "ID:", "Certificate No:"
-    for line in lines:
-        if re.search(r"(Roll No|Roll Number|ID|Cert No)\s*[:\-]?", line, re.IGNORECASE):
-            m = re.search(r"([A-Z0-9]{10,})", line)
+        # ID: "Roll No:", "ID:", "Certificate No:"
+        if data["roll_or_id"] is None and ID_LABEL_RE.search(line):
+            m = ID_VALUE_RE.search(line)
             if m:
                 data["roll_or_id"] = m.group(1)
-                break
 
-    # Session/Date: line with "MMM-MMM YYYY" pattern
-    for line in lines:
-        if re.search(r"[A-Z][a-z]{2}-[A-Z][a-z]{2}\s+\d{4}", line):
+        # Session/Date: line with "MMM-MMM YYYY" pattern
+        if data["issue_info"] is None and SESSION_RE.search(line):
             data["issue_info"] = line
-            break
 
     return data
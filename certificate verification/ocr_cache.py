@@ -0,0 +1,100 @@
+"""
+ocr_cache.py
+On-disk cache of OCR text keyed by the image bytes plus everything that can
+change the OCR output (engine, tesseract version, language, preprocessing
+profile). Size is bounded; least recently used entries are evicted first.
+Safe to share between the processes of a batch run.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+CACHE_DIR = Path(os.getenv("OCR_CACHE_DIR", "ocr_cache"))
+MAX_BYTES = int(float(os.getenv("OCR_CACHE_MAX_MB", "64")) * 1024 * 1024)
+
+# Bump when preprocessing or parsing changes what the cached text means
+CACHE_VERSION = 1
+
+# Evict down to this fraction of MAX_BYTES so we don't evict on every write,
+# and only scan the directory every EVICT_EVERY writes per process.
+EVICT_TARGET = 0.9
+EVICT_EVERY = 50
+
+_puts = 0
+
+
+def enabled():
+    return MAX_BYTES > 0
+
+
+def cache_key(image_bytes, engine, profile_cfg):
+    h = hashlib.sha256(image_bytes)
+    h.update(json.dumps({
+        "v": CACHE_VERSION,
+        "engine": engine.name,
+        "tesseract": engine.version,
+        "lang": engine.lang,
+        "profile": profile_cfg,
+    }, sort_keys=True).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _path(key):
+    return CACHE_DIR / key[:2] / f"{key}.txt"
+
+
+def get(key):
+    path = _path(key)
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    try:
+        os.utime(path)  # mark as recently used
+    except OSError:
+        pass
+    return text
+
+
+def put(key, text):
+    path = _path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+    global _puts
+    if _puts % EVICT_EVERY == 0:
+        evict()
+    _puts += 1
+
+
+def evict(max_bytes=None):
+    max_bytes = MAX_BYTES if max_bytes is None else max_bytes
+    entries = []
+    total = 0
+    for path in CACHE_DIR.glob("*/*.txt"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+        total += st.st_size
+
+    if total <= max_bytes:
+        return 0
+
+    removed = 0
+    target = max_bytes * EVICT_TARGET
+    for _, size, path in sorted(entries):
+        if total <= target:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
@@ -0,0 +1,138 @@
+"""
+ocr_engine.py
+Shared OCR engine. Prefers tesserocr, which keeps tesseract loaded in-process
+(a small pool of PyTessBaseAPI workers, language data read once per worker),
+and falls back to pytesseract, which starts a tesseract process per image.
+"""
+
+import os
+import queue
+import threading
+from functools import cached_property
+
+OCR_LANG = os.getenv("OCR_LANG", "eng")
+OCR_POOL_SIZE = int(os.getenv("OCR_POOL_SIZE", str(os.cpu_count() or 1)))
+
+# "auto" | "tesserocr" | "subprocess"
+OCR_ENGINE = os.getenv("OCR_ENGINE", "auto").lower()
+
+
+class TesserocrEngine:
+    name = "tesserocr"
+
+    def __init__(self, lang=OCR_LANG, pool_size=OCR_POOL_SIZE):
+        import tesserocr
+
+        self._tesserocr = tesserocr
+        self.lang = lang
+        self.pool_size = max(1, pool_size)
+        self.version = tesserocr.tesseract_version().splitlines()[0]
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+        # Fail here (and let get_engine fall back) if language data is missing
+        self._idle.put(self._new_api())
+
+    def _new_api(self):
+        with self._lock:
+            self._created += 1
+        try:
+            return self._tesserocr.PyTessBaseAPI(lang=self.lang)
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _checkout(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_grow = self._created < self.pool_size
+        if can_grow:
+            return self._new_api()
+        return self._idle.get()
+
+    def image_to_string(self, img):
+        api = self._checkout()
+        try:
+            api.SetImage(img)
+            return api.GetUTF8Text()
+        finally:
+            api.Clear()
+            self._idle.put(api)
+
+    def image_to_text_conf(self, img):
+        """(text, mean word confidence 0-100)"""
+        api = self._checkout()
+        try:
+            api.SetImage(img)
+            text = api.GetUTF8Text()
+            return text, float(api.MeanTextConf())
+        finally:
+            api.Clear()
+            self._idle.put(api)
+
+
+class SubprocessEngine:
+    name = "pytesseract"
+
+    def __init__(self, lang=OCR_LANG):
+        import pytesseract
+
+        self._pytesseract = pytesseract
+        self.lang = lang
+
+    @cached_property
+    def version(self):
+        return str(self._pytesseract.get_tesseract_version())
+
+    def image_to_string(self, img):
+        return self._pytesseract.image_to_string(img, lang=self.lang)
+
+    def image_to_text_conf(self, img):
+        """(text, mean word confidence 0-100)"""
+        data = self._pytesseract.image_to_data(
+            img, lang=self.lang, output_type=self._pytesseract.Output.DICT
+        )
+        # Rebuild tesseract's line layout; parsers work line by line
+        lines, confs = {}, []
+        for i, word in enumerate(data["text"]):
+            conf = float(data["conf"][i])
+            if word.strip() and conf >= 0:
+                line = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+                lines.setdefault(line, []).append(word)
+                confs.append(conf)
+        text = "\n".join(" ".join(words) for words in lines.values())
+        return text, (sum(confs) / len(confs) if confs else 0.0)
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def create_engine(kind=OCR_ENGINE):
+    if kind in ("auto", "tesserocr"):
+        try:
+            return TesserocrEngine()
+        except Exception as e:
+            if kind == "tesserocr":
+                raise
+            print(f"[OCR] tesserocr unavailable ({e}); using pytesseract subprocess")
+    return SubprocessEngine()
+
+
+def get_engine():
+    """Process-wide engine, created on first use."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine()
+    return _engine
+
+
+def image_to_string(img):
+    return get_engine().image_to_string(img)
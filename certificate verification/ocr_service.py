@@ -1,8 +1,70 @@
+import io
+import time
+
 from PIL import Image
 import pytesseract
+import ocr_cache
+import pdf_input
+from ocr_engine import get_engine
+from preprocess import preprocess_image, resolve_profile
 
 pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
 
-def extract_text_from_image(image_path: str) -> str:
-    img = Image.open(image_path)
-    return pytesseract.image_to_string(img)
+def _ocr_page(engine, img, profile, timings):
+    img, steps = preprocess_image(img, profile)
+
+    start = time.perf_counter()
+    text = engine.image_to_string(img)
+
+    if timings is not None:
+        # Summed over pages for multi-page PDFs
+        pre = timings.setdefault("preprocess", {})
+        for step, ms in steps.items():
+            pre[step] = round(pre.get(step, 0) + ms, 2)
+        timings["ocr_ms"] = round(timings.get("ocr_ms", 0) + (time.perf_counter() - start) * 1000, 2)
+    return text
+
+def extract_text_from_image(image_path: str, profile=None, timings=None) -> str:
+    """
+    image_path: an image, or a PDF (text layer if present, else the first
+    pages are rasterized and OCR'd; see pdf_input).
+    profile: preprocessing profile name from preprocess.PROFILES (None = default).
+    timings: optional dict, filled with per-step milliseconds.
+    Repeated uploads of the same file are answered from ocr_cache.
+    """
+    with open(image_path, "rb") as f:
+        data = f.read()
+
+    is_pdf = pdf_input.is_pdf_bytes(data)
+    if is_pdf:
+        text = pdf_input.text_layer(image_path)
+        if text:
+            if timings is not None:
+                timings["pdf_text_layer"] = True
+            return text
+
+    engine = get_engine()
+    key = None
+    if ocr_cache.enabled():
+        profile_cfg = resolve_profile(profile)
+        if is_pdf:
+            profile_cfg = {**profile_cfg, "pdf": pdf_input.render_settings()}
+        key = ocr_cache.cache_key(data, engine, profile_cfg)
+        cached = ocr_cache.get(key)
+        if cached is not None:
+            if timings is not None:
+                timings["ocr_cache"] = "hit"
+            return cached
+
+    if is_pdf:
+        pages = pdf_input.iter_page_images(image_path)
+    else:
+        pages = [Image.open(io.BytesIO(data))]
+    text = "\n".join(_ocr_page(engine, img, profile, timings) for img in pages)
+
+    if key:
+        ocr_cache.put(key, text)
+
+    if timings is not None and key:
+        timings["ocr_cache"] = "miss"
+    return text
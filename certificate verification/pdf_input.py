@@ -0,0 +1,63 @@
+"""
+pdf_input.py
+PDF certificates. Digitally issued PDFs carry a text layer that is read
+directly, with no OCR; scanned PDFs are rasterized one page at a time at a
+bounded DPI and only the first CERT_PDF_MAX_PAGES pages are looked at.
+pdfplumber / pdf2image (poppler) are only imported when a PDF turns up.
+"""
+
+import os
+
+PDF_MAX_PAGES = int(os.getenv("CERT_PDF_MAX_PAGES", "1"))
+PDF_DPI = min(int(os.getenv("CERT_PDF_DPI", "200")), 300)
+
+# Less text than this means an image-only page (or just a stray footer)
+MIN_TEXT_CHARS = 40
+
+# Enough detail for the 9x8 perceptual hash, and renders in a few ms
+HASH_DPI = 36
+
+
+def is_pdf_bytes(data):
+    return data[:5] == b"%PDF-"
+
+
+def is_pdf(path):
+    with open(path, "rb") as f:
+        return is_pdf_bytes(f.read(5))
+
+
+def render_settings():
+    # Part of the OCR cache key: rendering changes what tesseract sees
+    return {"dpi": PDF_DPI, "max_pages": PDF_MAX_PAGES}
+
+
+def text_layer(path, max_pages=PDF_MAX_PAGES):
+    """Embedded text of the first pages, or "" if the PDF is a scan."""
+    import pdfplumber
+
+    parts = []
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages[:max_pages]:
+            parts.append(page.extract_text() or "")
+            page.close()  # drop parsed objects before the next page
+
+    text = "\n".join(parts)
+    return text if len(text.strip()) >= MIN_TEXT_CHARS else ""
+
+
+def iter_page_images(path, dpi=PDF_DPI, max_pages=PDF_MAX_PAGES):
+    """Render pages one by one, so at most one bitmap is alive at a time."""
+    from pdf2image import convert_from_path
+
+    for page_no in range(1, max_pages + 1):
+        images = convert_from_path(path, dpi=dpi, first_page=page_no, last_page=page_no)
+        if not images:
+            break
+        yield images[0]
+
+
+def first_page_image(path, dpi=PDF_DPI):
+    for img in iter_page_images(path, dpi=dpi, max_pages=1):
+        return img
+    raise ValueError(f"PDF has no pages: {path}")
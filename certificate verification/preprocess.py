@@ -0,0 +1,168 @@
+"""
+preprocess.py
+Image clean-up before certificate OCR: grayscale, downscale to a target DPI,
+border crop, deskew and binarization. Each step is switched on per profile.
+"""
+
+import os
+import time
+
+import numpy as np
+from PIL import Image, ImageFilter, ImageOps
+
+# Certificates are A4/Letter; the long side is ~11.7in, so 300 DPI ~ 3500px.
+PAGE_LONG_SIDE_INCHES = 11.69
+
+PROFILES = {
+    # Leave the image exactly as uploaded
+    "raw": {},
+    # Clean scans / exported images: only shrink oversized files
+    "scan": {"grayscale": True, "target_dpi": 300, "crop_border": True},
+    # Default: phone photo or scan, tesseract does its own thresholding
+    "default": {"grayscale": True, "target_dpi": 300, "deskew": True, "crop_border": True},
+    # Unevenly lit phone photos: local-mean thresholding handles shadows
+    "photo": {
+        "grayscale": True, "target_dpi": 300, "deskew": True,
+        "binarize": "adaptive", "crop_border": True,
+    },
+}
+
+DEFAULT_PROFILE = os.getenv("CERT_PREPROCESS_PROFILE", "default")
+
+MAX_SKEW_DEGREES = 5.0
+SKEW_STEP_DEGREES = 0.5
+SKEW_SAMPLE_SIDE = 800
+
+
+# ---------------------------------------------------------------------------
+# STEPS
+# ---------------------------------------------------------------------------
+def to_grayscale(img):
+    if img.mode in ("RGBA", "LA", "P"):
+        img = img.convert("RGBA")
+        background = Image.new("RGBA", img.size, "white")
+        img = Image.alpha_composite(background, img)
+    return img.convert("L")
+
+
+def downscale(img, target_dpi):
+    max_side = int(target_dpi * PAGE_LONG_SIDE_INCHES)
+    if max(img.size) <= max_side:
+        return img
+    img = img.copy()
+    img.thumbnail((max_side, max_side), Image.LANCZOS)
+    return img
+
+
+def otsu_threshold(gray):
+    hist = np.bincount(np.asarray(gray, dtype=np.uint8).ravel(), minlength=256).astype(float)
+    total = hist.sum()
+    levels = np.arange(256)
+
+    weight_bg = np.cumsum(hist)
+    weight_fg = total - weight_bg
+    mean_bg = np.cumsum(hist * levels)
+    mean_total = mean_bg[-1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        between = (mean_total * weight_bg / total - mean_bg) ** 2 / (weight_bg * weight_fg)
+    if not np.isfinite(between).any():
+        return 127  # single-tone image
+    return int(np.nanargmax(between))
+
+
+def binarize(img, method="otsu"):
+    if method == "adaptive":
+        # Pixel is ink if clearly darker than its neighbourhood mean
+        local_mean = np.asarray(img.filter(ImageFilter.BoxBlur(15)), dtype=np.int16)
+        pixels = np.asarray(img, dtype=np.int16)
+        ink = pixels < local_mean - 10
+    else:
+        ink = np.asarray(img) <= otsu_threshold(img)
+    return Image.fromarray(np.where(ink, 0, 255).astype(np.uint8), mode="L")
+
+
+def estimate_skew(img):
+    # Text lines give the sharpest row profile when they are horizontal
+    sample = img.copy()
+    sample.thumbnail((SKEW_SAMPLE_SIDE, SKEW_SAMPLE_SIDE))
+    sample = ImageOps.invert(binarize(sample))
+
+    best_angle, best_score = 0.0, -1.0
+    steps = int(MAX_SKEW_DEGREES / SKEW_STEP_DEGREES)
+    for i in range(-steps, steps + 1):
+        angle = i * SKEW_STEP_DEGREES
+        rows = np.asarray(sample.rotate(angle, expand=False), dtype=np.float32).sum(axis=1)
+        score = float(np.var(rows))
+        if score > best_score:
+            best_angle, best_score = angle, score
+    return best_angle
+
+
+def deskew(img):
+    angle = estimate_skew(img)
+    if angle == 0:
+        return img
+    return img.rotate(angle, resample=Image.BICUBIC, expand=True, fillcolor=255)
+
+
+def crop_border(img, margin=20, frame_ratio=0.6):
+    ink = np.asarray(img) < 128
+
+    # Drop outer rows/columns that are mostly dark: table, background, scanner edge
+    rows = np.where(ink.mean(axis=1) < frame_ratio)[0]
+    cols = np.where(ink.mean(axis=0) < frame_ratio)[0]
+    if len(rows) == 0 or len(cols) == 0:
+        return img
+
+    top, bottom, left, right = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+    inner = ink[top:bottom, left:right]
+    ys, xs = np.nonzero(inner)
+    if len(ys) == 0:
+        return img
+
+    h, w = ink.shape
+    box = (
+        max(0, left + xs.min() - margin),
+        max(0, top + ys.min() - margin),
+        min(w, left + xs.max() + 1 + margin),
+        min(h, top + ys.max() + 1 + margin),
+    )
+    return img.crop(box)
+
+
+# ---------------------------------------------------------------------------
+# PIPELINE
+# ---------------------------------------------------------------------------
+def resolve_profile(profile=None):
+    if isinstance(profile, dict):
+        return profile
+    return PROFILES[profile or DEFAULT_PROFILE]
+
+
+def preprocess_image(img, profile=None):
+    """
+    Run the steps enabled in the profile (name or dict).
+    Returns (image, timings) with per-step milliseconds.
+    """
+    cfg = resolve_profile(profile)
+    timings = {}
+
+    def step(name, fn, *args):
+        start = time.perf_counter()
+        out = fn(*args)
+        timings[name] = round((time.perf_counter() - start) * 1000, 2)
+        return out
+
+    if cfg.get("grayscale"):
+        img = step("grayscale", to_grayscale, img)
+    if cfg.get("target_dpi"):
+        img = step("downscale", downscale, img, cfg["target_dpi"])
+    if cfg.get("crop_border"):
+        img = step("crop_border", crop_border, img.convert("L"))
+    if cfg.get("deskew"):
+        img = step("deskew", deskew, img.convert("L"))
+    if cfg.get("binarize"):
+        img = step("binarize", binarize, img.convert("L"), cfg["binarize"])
+
+    return img, timings
@@ -0,0 +1,228 @@
+"""
+providers.py
+Registry of certificate providers. Each provider declares signature
+patterns and a parser; classify() scans the OCR text once with a single
+combined regex and parse_certificate_text() routes to the matching parser,
+falling back to the generic heuristic parser. Providers with a fixed layout
+can also declare field regions for ROI OCR (see roi.py).
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from generic_parser import parse_generic_certificate
+from parse_certificate import parse_nptel_certificate
+
+# Keys every parsed certificate has, whichever parser produced it
+# (certificate_service.verify_claim / compute_validity_generic read these)
+COMMON_FIELDS = (
+    "platform", "student_name", "course_title", "score_percent",
+    "issue_info", "roll_or_id", "provider_guess",
+)
+
+
+@dataclass
+class Provider:
+    name: str
+    signatures: List[str]
+    parse: Callable[[str], Dict]
+    # region -> (left, top, right, bottom) as fractions of the page. Regions
+    # named after a COMMON_FIELDS key are read straight into that field; all
+    # region text also goes through parse() for the provider-specific keys.
+    regions: Dict[str, Tuple[float, float, float, float]] = field(default_factory=dict)
+
+
+PROVIDERS: List[Provider] = []
+_classifier = None
+
+
+def register_provider(name: str, signatures: List[str], parse: Callable[[str], Dict],
+                      regions: Optional[Dict[str, Tuple[float, float, float, float]]] = None) -> None:
+    global _classifier
+    PROVIDERS[:] = [p for p in PROVIDERS if p.name != name]
+    PROVIDERS.append(Provider(name, signatures, parse, regions or {}))
+    _classifier = None
+
+
+def _build_classifier():
+    # One alternation, one named group per provider: p0, p1, ...
+    parts = [
+        f"(?P<p{i}>{'|'.join(f'(?:{s})' for s in p.signatures)})"
+        for i, p in enumerate(PROVIDERS)
+    ]
+    return re.compile("|".join(parts), re.IGNORECASE)
+
+
+def classify(text: str) -> Optional[Provider]:
+    """Provider with the most signature hits, or None (ties go to the first registered)."""
+    global _classifier
+    if _classifier is None:
+        _classifier = _build_classifier()
+
+    hits = [0] * len(PROVIDERS)
+    for m in _classifier.finditer(text):
+        hits[int(m.lastgroup[1:])] += 1
+
+    best = max(range(len(hits)), key=lambda i: (hits[i], -i), default=None)
+    if best is None or hits[best] == 0:
+        return None
+    return PROVIDERS[best]
+
+
+def parse_certificate_text(text: str) -> Dict:
+    provider = classify(text)
+    if provider is None:
+        data = parse_generic_certificate(text)
+        data["platform"] = None
+    else:
+        data = provider.parse(text)
+        data["platform"] = provider.name
+
+    for key in COMMON_FIELDS:
+        data.setdefault(key, None)
+    return data
+
+
+# ---------------------------------------------------------------------------
+# NPTEL
+# ---------------------------------------------------------------------------
+def parse_nptel(text: str) -> Dict:
+    data = parse_nptel_certificate(text)
+    data["roll_or_id"] = data["roll_no"]
+    data["issue_info"] = data["session"]
+    data["provider_guess"] = "NPTEL"
+
+    # Layout drift (case, spacing, missing labels) defeats the NPTEL
+    # patterns; take whatever the generic heuristics find instead of None
+    missing = [k for k in COMMON_FIELDS if data.get(k) is None]
+    if missing:
+        generic = parse_generic_certificate(text)
+        for key in missing:
+            if generic.get(key) is not None:
+                data[key] = generic[key]
+    return data
+
+
+# ---------------------------------------------------------------------------
+# COURSERA
+# ---------------------------------------------------------------------------
+COURSERA_COMPLETED_RE = re.compile(r"has successfully completed", re.IGNORECASE)
+COURSERA_DATE_RE = re.compile(r"\b([A-Z][a-z]{2,8}\.?\s+\d{1,2},\s+\d{4})\b")
+COURSERA_VERIFY_RE = re.compile(r"coursera\.org/verify/(?:[\w-]+/)?([A-Z0-9]{8,})", re.IGNORECASE)
+COURSERA_AUTHORIZED_RE = re.compile(r"authorized by (.+?)(?: and offered through|$)", re.IGNORECASE)
+
+
+def parse_coursera(text: str) -> Dict:
+    lines = [l.strip() for l in text.splitlines() if l.strip()]
+    data = {
+        "student_name": None,
+        "course_title": None,
+        "issue_info": None,
+        "roll_or_id": None,
+        "institution": None,
+        "provider_guess": "Coursera",
+    }
+
+    for i, line in enumerate(lines):
+        if COURSERA_COMPLETED_RE.search(line):
+            if i > 0:
+                data["student_name"] = lines[i - 1]
+            if i + 1 < len(lines):
+                data["course_title"] = lines[i + 1]
+            break
+
+    m = COURSERA_DATE_RE.search(text)
+    if m:
+        data["issue_info"] = m.group(1)
+
+    m = COURSERA_VERIFY_RE.search(text)
+    if m:
+        data["roll_or_id"] = m.group(1)
+
+    m = COURSERA_AUTHORIZED_RE.search(text)
+    if m:
+        data["institution"] = m.group(1).strip()
+
+    return data
+
+
+# ---------------------------------------------------------------------------
+# UDEMY
+# ---------------------------------------------------------------------------
+UDEMY_HEADER_RE = re.compile(r"certificate of completion", re.IGNORECASE)
+UDEMY_META_RE = re.compile(r"^(certificate (no|url)|reference number)\b", re.IGNORECASE)
+UDEMY_ID_RE = re.compile(r"\b(UC-[0-9a-f-]{8,})", re.IGNORECASE)
+UDEMY_INSTRUCTORS_RE = re.compile(r"^instructors?\s+(.+)$", re.IGNORECASE)
+UDEMY_DATE_RE = re.compile(r"^date\s+(.+)$", re.IGNORECASE)
+UDEMY_LENGTH_RE = re.compile(r"^length\s+(.+)$", re.IGNORECASE)
+
+
+def parse_udemy(text: str) -> Dict:
+    lines = [l.strip() for l in text.splitlines() if l.strip()]
+    data = {
+        "student_name": None,
+        "course_title": None,
+        "issue_info": None,
+        "roll_or_id": None,
+        "instructor": None,
+        "duration": None,
+        "provider_guess": "Udemy",
+    }
+
+    m = UDEMY_ID_RE.search(text)
+    if m:
+        data["roll_or_id"] = m.group(1)
+
+    after_header = False
+    for i, line in enumerate(lines):
+        if UDEMY_HEADER_RE.search(line):
+            after_header = True
+            continue
+        if UDEMY_META_RE.match(line):
+            continue
+
+        m = UDEMY_INSTRUCTORS_RE.match(line)
+        if m:
+            data["instructor"] = m.group(1)
+            # The learner's name is printed right under the instructors
+            if i + 1 < len(lines) and data["student_name"] is None:
+                data["student_name"] = lines[i + 1]
+            continue
+
+        m = UDEMY_DATE_RE.match(line)
+        if m:
+            data["issue_info"] = m.group(1)
+            continue
+
+        m = UDEMY_LENGTH_RE.match(line)
+        if m:
+            data["duration"] = m.group(1)
+            continue
+
+        if after_header and data["course_title"] is None:
+            data["course_title"] = line
+
+    return data
+
+
+register_provider("NPTEL", [
+    r"\bNPTEL\b", r"Online Assignments", r"Proctored Exam", r"No\. of credits recommended",
+], parse_nptel, regions={
+    # Measured on the 2024-25 landscape template, after border crop
+    "student_name": (0.15, 0.30, 0.85, 0.40),
+    "course_title": (0.10, 0.44, 0.90, 0.54),
+    "score_percent": (0.25, 0.54, 0.75, 0.61),
+    "scores": (0.05, 0.61, 0.95, 0.67),        # Online Assignments | .. Proctored Exam | ..
+    "session": (0.00, 0.70, 0.60, 0.78),       # "Jul-Sep 2025 Prof. ..." -> issue_info
+    "details": (0.00, 0.78, 1.00, 0.90),       # duration, credits
+    "roll_or_id": (0.00, 0.90, 0.60, 1.00),
+})
+
+register_provider("Coursera", [
+    r"\bcoursera\b", r"online non-credit course", r"coursera\.org/verify",
+], parse_coursera)
+
+register_provider("Udemy", [
+    r"\budemy\b", r"ude\.my/", r"\bUC-[0-9a-f]{6,}", r"\btotal hours\b",
+], parse_udemy)
@@ -0,0 +1,273 @@
+# api.py
+#
+# Headless screening service for ATS integration:
+#
+#   uvicorn api:app --host 0.0.0.0 --port 8000
+#
+# CPU work (parsing, embeddings, OCR) runs on a pool of pre-warmed worker
+# processes; GitHub analysis (network bound) on a thread pool. Requests wait
+# in a bounded queue and get 429 once it is full, so a burst can't pile up
+# unbounded work. Per-endpoint latency histograms and each worker's
+# embedding batcher stats are served on /metrics.
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import requests
+from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+import api_workers
+from github_analyzer import GitHubGraphQLError, GitHubNotFound, analyze_github_profile
+from github_client import GitHubRateLimitError
+
+API_WORKERS = int(os.getenv("API_WORKERS", str(os.cpu_count() or 2)))
+GITHUB_WORKERS = int(os.getenv("API_GITHUB_WORKERS", "4"))
+
+# Requests allowed to wait for a worker (on top of those running)
+API_MAX_QUEUE = int(os.getenv("API_MAX_QUEUE", str(API_WORKERS * 4)))
+API_MAX_UPLOAD_MB = float(os.getenv("API_MAX_UPLOAD_MB", "10"))
+
+# Histogram bucket upper bounds, milliseconds
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+# ---------------------------------------------------------------------------
+# BACKPRESSURE
+# ---------------------------------------------------------------------------
+class Saturated(Exception):
+    pass
+
+
+class BoundedPool:
+    """
+    An executor with admission control: at most workers + max_queue tasks
+    in the system at once, anything beyond is rejected immediately.
+    """
+
+    def __init__(self, name, executor, workers, max_queue):
+        self.name = name
+        self.executor = executor
+        self.workers = workers
+        self.capacity = workers + max_queue
+        self.in_flight = 0
+        self.rejected = 0
+
+    async def run(self, fn, *args):
+        if self.in_flight >= self.capacity:
+            self.rejected += 1
+            raise Saturated(self.name)
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, fn, *args)
+        finally:
+            self.in_flight -= 1
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "queued": max(0, self.in_flight - self.workers),
+            "capacity": self.capacity,
+            "rejected": self.rejected,
+        }
+
+
+# ---------------------------------------------------------------------------
+# LATENCY HISTOGRAMS
+# ---------------------------------------------------------------------------
+class LatencyHistogram:
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last = +Inf
+        self.total = 0
+        self.sum_ms = 0.0
+
+    def observe(self, ms):
+        i = 0
+        while i < len(self.buckets) and ms > self.buckets[i]:
+            i += 1
+        self.counts[i] += 1
+        self.total += 1
+        self.sum_ms += ms
+
+    def quantile(self, q):
+        # Upper bound of the bucket holding the q-th observation
+        if not self.total:
+            return None
+        rank = q * self.total
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def to_dict(self):
+        bounds = [str(b) for b in self.buckets] + ["+Inf"]
+        return {
+            "count": self.total,
+            "mean_ms": round(self.sum_ms / self.total, 1) if self.total else None,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": dict(zip(bounds, self.counts)),
+        }
+
+
+latency = {}
+status_counts = {}
+
+
+# ---------------------------------------------------------------------------
+# APP
+# ---------------------------------------------------------------------------
+pools = {}
+# pid -> that worker's embedding micro-batcher stats (a Manager dict)
+embedding_stats = {}
+
+
+@asynccontextmanager
+async def lifespan(app):
+    global embedding_stats
+    manager = multiprocessing.Manager()
+    embedding_stats = manager.dict()
+
+    cpu = ProcessPoolExecutor(max_workers=API_WORKERS, initializer=api_workers.init_worker,
+                              initargs=(embedding_stats,))
+    io = ThreadPoolExecutor(max_workers=GITHUB_WORKERS, thread_name_prefix="github")
+    pools["cpu"] = BoundedPool("cpu", cpu, API_WORKERS, API_MAX_QUEUE)
+    pools["io"] = BoundedPool("io", io, GITHUB_WORKERS, API_MAX_QUEUE)
+
+    # Start every worker (and load its models) before taking traffic
+    start = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    pids = await asyncio.gather(*[loop.run_in_executor(cpu, api_workers.ping) for _ in range(API_WORKERS)])
+    print(f"[API] {len(set(pids))} workers warm in {time.perf_counter() - start:.1f}s")
+
+    yield
+
+    cpu.shutdown(cancel_futures=True)
+    io.shutdown(cancel_futures=True)
+    manager.shutdown()
+
+
+app = FastAPI(title="AI Hiring Platform API", lifespan=lifespan)
+
+
+@app.middleware("http")
+async def record_latency(request: Request, call_next):
+    start = time.perf_counter()
+    response = await call_next(request)
+    ms = (time.perf_counter() - start) * 1000
+
+    route = request.scope.get("route")
+    key = f"{request.method} {route.path if route else 'unmatched'}"
+    latency.setdefault(key, LatencyHistogram()).observe(ms)
+    status_counts.setdefault(key, {}).setdefault(str(response.status_code), 0)
+    status_counts[key][str(response.status_code)] += 1
+    return response
+
+
+@app.exception_handler(Saturated)
+async def saturated_handler(request: Request, exc: Saturated):
+    return JSONResponse(
+        status_code=429,
+        content={"detail": f"Server busy ({exc} pool full), retry shortly"},
+        headers={"Retry-After": "2"},
+    )
+
+
+async def read_upload(upload: UploadFile) -> bytes:
+    data = await upload.read()
+    if len(data) > API_MAX_UPLOAD_MB * 1024 * 1024:
+        raise HTTPException(413, f"File larger than {API_MAX_UPLOAD_MB:g} MB")
+    if not data:
+        raise HTTPException(400, "Empty file")
+    return data
+
+
+async def run_cpu(fn, *args):
+    try:
+        return await pools["cpu"].run(fn, *args)
+    except ValueError as e:  # unsupported / unreadable file
+        raise HTTPException(422, str(e))
+
+
+# ---------------------------------------------------------------------------
+# ENDPOINTS
+# ---------------------------------------------------------------------------
+class MatchRequest(BaseModel):
+    resume: dict
+    jd: dict
+    source_url: Optional[str] = None
+
+
+@app.get("/healthz")
+async def healthz():
+    return {"status": "ok"}
+
+
+@app.get("/metrics")
+async def metrics():
+    return {
+        "pools": {name: pool.stats() for name, pool in pools.items()},
+        "latency": {key: h.to_dict() for key, h in latency.items()},
+        "status": status_counts,
+        "embedding": dict(embedding_stats),
+    }
+
+
+@app.post("/jd/parse")
+async def parse_jd(file: UploadFile = File(...)):
+    data = await read_upload(file)
+    ext = os.path.splitext(file.filename or "")[1].lower().lstrip(".") or None
+    return await run_cpu(api_workers.parse_jd_task, data, ext)
+
+
+@app.post("/resume/parse")
+async def parse_resume(file: UploadFile = File(...)):
+    data = await read_upload(file)
+    return await run_cpu(api_workers.parse_resume_task, data, file.filename)
+
+
+@app.post("/match")
+async def match(req: MatchRequest):
+    return await run_cpu(api_workers.match_task, req.resume, req.jd, req.source_url)
+
+
+@app.get("/github/{username}")
+async def github(username: str):
+    try:
+        score, repos = await pools["io"].run(analyze_github_profile, username)
+    except GitHubNotFound as e:
+        raise HTTPException(404, str(e))
+    except GitHubRateLimitError as e:
+        raise HTTPException(503, str(e), headers={"Retry-After": "60"})
+    except (ValueError, GitHubGraphQLError, requests.RequestException) as e:
+        # GitHub answered with an error status, or could not be reached
+        raise HTTPException(502, str(e))
+    return {"username": username, "score": score, "repos": repos}
+
+
+@app.post("/certificate/verify")
+async def verify_certificate(
+    file: UploadFile = File(...),
+    claimed_name: str = Form(...),
+    claimed_course: str = Form(...),
+):
+    data = await read_upload(file)
+    return await run_cpu(api_workers.verify_certificate_task, data, file.filename, claimed_name, claimed_course)
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host=os.getenv("API_HOST", "127.0.0.1"), port=int(os.getenv("API_PORT", "8000")))
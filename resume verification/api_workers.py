@@ -0,0 +1,102 @@
+# api_workers.py
+#
+# Functions run inside the API's worker processes. Each worker imports the
+# parsers (and with them the embedding / spaCy / YAKE models) once, in
+# init_worker, so requests never pay the model load.
+#
+# Each worker has its own embedding micro-batcher; its stats() are published
+# into a dict shared with the API process (a multiprocessing.Manager dict)
+# after tasks, at most every STATS_PUBLISH_SECONDS, for /metrics.
+
+import functools
+import os
+import tempfile
+import time
+
+from cert_path import add_cert_dir
+
+
+STATS_PUBLISH_SECONDS = 1.0
+
+_shared_stats = None
+_last_publish = 0.0
+
+
+def init_worker(shared_stats=None):
+    global _shared_stats
+    _shared_stats = shared_stats
+
+    # One model replica per process: stop each one from also spawning a full
+    # set of BLAS / OpenMP threads
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+    import jd_pdf_parser
+    jd_pdf_parser.get_embedding("warm up")
+    publish_stats(force=True)
+
+
+def publish_stats(force=False):
+    global _last_publish
+    if _shared_stats is None:
+        return
+    now = time.monotonic()
+    if not force and now - _last_publish < STATS_PUBLISH_SECONDS:
+        return
+    _last_publish = now
+
+    from jd_pdf_parser import embedder
+    try:
+        _shared_stats[str(os.getpid())] = embedder.stats()
+    except (OSError, EOFError):
+        pass  # manager already shut down
+
+
+def _publishes_stats(fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            publish_stats()
+    return wrapper
+
+
+def ping():
+    return os.getpid()
+
+
+# ---------------------------------------------------------------------------
+# TASKS
+# ---------------------------------------------------------------------------
+@_publishes_stats
+def parse_jd_task(data: bytes, file_type: str = None):
+    from jd_pdf_parser import parse_job_description_pdf
+    return parse_job_description_pdf(data, file_type=file_type)
+
+
+@_publishes_stats
+def parse_resume_task(data: bytes, filename: str = None):
+    from resume_parser import parse_resume_file
+    return parse_resume_file(data, name=filename)
+
+
+@_publishes_stats
+def match_task(resume: dict, jd: dict, source_url: str = None):
+    from matching import compute_match_record
+    from records import JDRecord, ResumeRecord
+    record = compute_match_record(ResumeRecord.from_dict(resume), JDRecord.from_dict(jd), source_url)
+    return record.to_dict()
+
+
+def verify_certificate_task(data: bytes, filename: str, claimed_name: str, claimed_course: str):
+    add_cert_dir()
+    from certificate_service import handle_uploaded_certificate
+
+    # The OCR pipeline reads from a path: scratch file private to this request
+    suffix = os.path.splitext(filename or "")[1] or ".png"
+    with tempfile.TemporaryDirectory(prefix="cert_") as tmp:
+        path = os.path.join(tmp, f"certificate{suffix}")
+        with open(path, "wb") as f:
+            f.write(data)
+        return handle_uploaded_certificate(path, claimed_name, claimed_course, source_name=filename)
@@ -1,11 +1,17 @@
 import streamlit as st
-import json
+import hashlib
 from jd_pdf_parser import parse_job_description_pdf
 from google_finder import find_candidates_for_jd
 from resume_parser import parse_resume_file
-from matching import compute_match_for_resume
+from matching import compute_match_record
+from records import JDRecord, ResumeRecord
 from linkedin_finder import find_linkedin_candidates
-from github_analyzer import analyze_github_profile
+from github_analyzer import analyze_github_profile, readme_length, load_full_readme
+from github_client import rate_limit_status
+from github_batch import iter_github_batch, extract_github_usernames, dedupe_usernames, BATCH_MAX_REQUESTS
+from search_jobs import JobManager, CANCELLED, FAILED
+from results_view import render_resume_results, render_linkedin_results, skill_tags_html
+from results_export import render_export
 
 
 # Page config with custom theme
@@ -109,6 +115,79 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def parse_jd(content_hash: str, ext: str, _data: bytes) -> dict:
+    # Cached on the upload's content hash (_data is not hashed by Streamlit),
+    # so widget interactions don't re-run extraction, YAKE and the encodes.
+    # Parsed straight from memory: nothing is written to the working directory.
+    return parse_job_description_pdf(_data, file_type=ext)
+
+
+@st.cache_resource
+def job_manager():
+    # Background searches outlive the rerun (and session) that started them
+    return JobManager()
+
+
+def run_resume_search(job, jd_obj, max_downloads):
+    # The job keeps compact records (float32 embeddings, resume shared by
+    # reference); they become dicts only when rendered or exported
+    jd_record = JDRecord.from_dict(jd_obj)
+
+    def parse_and_score(resume_file, jd_obj, source_url=None):
+        res = parse_resume_file(resume_file)
+        res["path"] = resume_file.name
+        return compute_match_record(ResumeRecord.from_dict(res), jd_record, source_url)
+
+    find_candidates_for_jd(
+        jd_obj, parse_and_score, max_downloads=max_downloads,
+        on_progress=job.set_progress, on_result=job.add_result, cancel_event=job.cancel_event,
+    )
+
+
+def show_resume_search(job, show_text, live):
+    state = job.snapshot()
+    records = job.results()
+    results = [r.to_dict() for r in records]
+
+    if live and job.finished_running:
+        st.rerun()  # full rerun: re-creates this fragment without polling
+
+    if not job.finished_running:
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            fraction = min(state["done"] / state["total"], 1.0) if state["total"] else 0.0
+            st.progress(fraction, text=f"{state['stage']}... {state['results']} candidates scored so far")
+        with col2:
+            if st.button("Cancel Search", key=f"cancel_{job.id}", use_container_width=True):
+                job.cancel()
+        render_resume_results(results, show_text)
+        return
+
+    if state["status"] == FAILED:
+        st.error(f"Search failed: {state['error']}")
+    elif state["status"] == CANCELLED:
+        st.warning(f"Search cancelled after scoring {len(results)} candidates")
+    elif not results:
+        st.error("No public resumes found. Try adjusting your search criteria.")
+    else:
+        st.success(f"Found {len(results)} matching candidates")
+
+    if results:
+        render_resume_results(results, show_text)
+
+        render_export(records, "google", "google_resume_results")
+
+
+def shortlist_row(r):
+    return {
+        "Username": r["username"],
+        "Score": r["score"],
+        "Repositories": len(r["repos"]),
+        "Error": r["error"] or "",
+    }
+
+
 # Main header
 st.markdown('<h1 class="main-header">AI Hiring Platform</h1>', unsafe_allow_html=True)
 st.markdown('<p class="subtitle">Automated JD + Resume + LinkedIn + GitHub Analysis</p>', unsafe_allow_html=True)
@@ -129,14 +208,12 @@ with col2:
     st.markdown("PDF Documents | Word Documents (.docx)")
 
 if uploaded_jd:
-    ext = uploaded_jd.name.split(".")[-1]
-    jd_path = f"uploaded_jd.{ext}"
-
-    with open(jd_path, "wb") as f:
-        f.write(uploaded_jd.getbuffer())
+    ext = uploaded_jd.name.split(".")[-1].lower()
+    jd_bytes = uploaded_jd.getvalue()
+    jd_hash = hashlib.sha256(jd_bytes).hexdigest()
 
     with st.spinner("Analyzing job description..."):
-        jd = parse_job_description_pdf(jd_path)
+        jd = parse_jd(jd_hash, ext, jd_bytes)
     
     st.success("JD parsed successfully")
 
@@ -146,8 +223,7 @@ if uploaded_jd:
     with col1:
         st.markdown('<div class="info-card">', unsafe_allow_html=True)
         st.markdown("*Required Skills*")
-        for skill in jd["skills"]:
-            st.markdown(f'<span class="skill-tag">{skill}</span>', unsafe_allow_html=True)
+        st.markdown(skill_tags_html(jd["skills"]), unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
 
         st.markdown('<div class="info-card">', unsafe_allow_html=True)
@@ -178,54 +254,19 @@ if uploaded_jd:
         show_text = st.checkbox("Show full resume text", False, help="Display complete resume content in results")
 
     if st.button("Search Public Resumes", use_container_width=True):
-        with st.spinner("Searching Google, downloading resumes, analyzing candidates..."):
+        previous = st.session_state.get("google_job")
+        if previous:
+            job_manager().cancel(previous["job_id"])
 
-            def parse_and_score(path, jd_obj, source_url=None):
-                res = parse_resume_file(path)
-                res["path"] = path
-                return compute_match_for_resume(res, jd_obj, source_url)
+        job = job_manager().submit(run_resume_search, jd, max_dl)
+        st.session_state["google_job"] = {"jd_hash": jd_hash, "job_id": job.id}
 
-            results = find_candidates_for_jd(jd, parse_and_score, max_downloads=max_dl)
-
-        if not results:
-            st.error("No public resumes found. Try adjusting your search criteria.")
-        else:
-            st.success(f"Found {len(results)} matching candidates")
-
-            for i, r in enumerate(results, start=1):
-                st.markdown(f'<div class="candidate-card">', unsafe_allow_html=True)
-                
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.markdown(f"{r['candidate_name']}")
-                with col2:
-                    st.markdown(f'<div class="score-badge">Match Score: {r["final_score"]:.1%}</div>', unsafe_allow_html=True)
-                
-                st.markdown(f"[View Source]({r['source_url']})")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown("*Matched Skills*")
-                    for skill in r["matched_skills"]:
-                        st.markdown(f'<span class="skill-tag">{skill}</span>', unsafe_allow_html=True)
-                
-                with col2:
-                    st.markdown("*Missing Skills*")
-                    for skill in r["missing_skills"]:
-                        st.markdown(f'<span class="missing-skill-tag">{skill}</span>', unsafe_allow_html=True)
-
-                if show_text:
-                    with st.expander("View Full Resume"):
-                        st.text(r["cleaned_text"])
-
-                st.markdown('</div>', unsafe_allow_html=True)
-
-            st.download_button(
-                "Download Results as JSON",
-                json.dumps(results, indent=2),
-                "google_resume_results.json",
-                use_container_width=True
-            )
+    saved = st.session_state.get("google_job")
+    job = job_manager().get(saved["job_id"]) if saved and saved["jd_hash"] == jd_hash else None
+    if job:
+        # Poll once a second while the search runs, then render statically
+        live = not job.finished_running
+        st.fragment(run_every=1.0 if live else None)(show_resume_search)(job, show_text, live)
 
 
     # ============================================================
@@ -237,47 +278,20 @@ if uploaded_jd:
     if st.button("Search LinkedIn Candidates", use_container_width=True):
         with st.spinner("Searching for LinkedIn profiles..."):
             linkedin_results = find_linkedin_candidates(jd)
+        st.session_state["linkedin_results"] = {"jd_hash": jd_hash, "results": linkedin_results}
+
+    saved = st.session_state.get("linkedin_results")
+    if saved and saved["jd_hash"] == jd_hash:
+        linkedin_results = saved["results"]
 
         if not linkedin_results:
             st.error("No LinkedIn candidates found")
         else:
             st.success(f"Found {len(linkedin_results)} LinkedIn candidates")
 
-            for i, c in enumerate(linkedin_results, start=1):
-                st.markdown(f'<div class="candidate-card">', unsafe_allow_html=True)
-                
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.markdown(f"{c['name']}")
-                    st.markdown(f"{c['headline']}")
-                with col2:
-                    st.markdown(f'<div class="score-badge">Match: {c["match_score"]}%</div>', unsafe_allow_html=True)
-                
-                st.markdown(f"[View LinkedIn Profile]({c['url']})")
-                
-                st.markdown("*Skills*")
-                for skill in c["skills"]:
-                    st.markdown(f'<span class="skill-tag">{skill}</span>', unsafe_allow_html=True)
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown("*Matched Skills*")
-                    for skill in c["matched_skills"]:
-                        st.markdown(f'<span class="skill-tag">{skill}</span>', unsafe_allow_html=True)
-                
-                with col2:
-                    st.markdown("*Missing Skills*")
-                    for skill in c["missing_skills"]:
-                        st.markdown(f'<span class="missing-skill-tag">{skill}</span>', unsafe_allow_html=True)
-                
-                st.markdown('</div>', unsafe_allow_html=True)
-
-            st.download_button(
-                "Download LinkedIn Results JSON",
-                json.dumps(linkedin_results, indent=2),
-                "linkedin_results.json",
-                use_container_width=True
-            )
+            render_linkedin_results(linkedin_results)
+
+            render_export(linkedin_results, "linkedin", "linkedin_results")
 
 
     # ============================================================
@@ -294,41 +308,104 @@ if uploaded_jd:
         with st.spinner("Analyzing GitHub activity, repositories, and contributions..."):
             try:
                 score, repos = analyze_github_profile(github_user)
-                
-                st.markdown(f'<div class="score-badge" style="font-size: 1.3rem;">Overall GitHub Score: {score}/100</div>', unsafe_allow_html=True)
-
-                for r in repos:
-                    st.markdown(f'<div class="candidate-card">', unsafe_allow_html=True)
-                    
-                    col1, col2 = st.columns([3, 1])
-                    with col1:
-                        st.markdown(f"{r['repo']}")
-                    with col2:
-                        st.markdown(f'<div class="score-badge">Score: {r["score"]}</div>', unsafe_allow_html=True)
-                    
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Stars", r['meta']['stars'])
-                    with col2:
-                        st.metric("Forks", r['meta']['forks'])
-                    with col3:
-                        st.metric("README", f"{len(r['meta']['readme'])} chars")
-                    
-                    st.markdown("*Languages*")
-                    for lang in r['meta']['languages']:
-                        st.markdown(f'<span class="skill-tag">{lang}</span>', unsafe_allow_html=True)
-                    
-                    st.markdown('</div>', unsafe_allow_html=True)
-
-                st.download_button(
-                    "Download GitHub Analysis JSON",
-                    json.dumps({"username": github_user, "score": score, "repos": repos}, indent=2),
-                    "github_analysis.json",
-                    use_container_width=True
-                )
+                st.session_state["github_profile"] = {
+                    "username": github_user,
+                    "score": score,
+                    "repos": repos,
+                    # One export row per repo, built once so render_export can keep its file
+                    "rows": [{"username": github_user, "profile_score": score, **r} for r in repos],
+                }
             except Exception as e:
+                st.session_state.pop("github_profile", None)
                 st.error(f"Error analyzing GitHub profile: {str(e)}")
 
+    profile = st.session_state.get("github_profile")
+    if profile:
+        score, repos = profile["score"], profile["repos"]
+
+        st.markdown(f'<div class="score-badge" style="font-size: 1.3rem;">Overall GitHub Score: {score}/100</div>', unsafe_allow_html=True)
+
+        quota = rate_limit_status()
+        col1, col2 = st.columns(2)
+        with col1:
+            core = quota["quota"].get("core")
+            if core:
+                st.metric("GitHub API Quota Left", f"{core['remaining']}/{core['limit']}")
+        with col2:
+            st.metric("Served from Cache (304)", quota["not_modified"])
+
+        for r in repos:
+            st.markdown(f'<div class="candidate-card">', unsafe_allow_html=True)
+            
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.markdown(f"{r['repo']}")
+            with col2:
+                st.markdown(f'<div class="score-badge">Score: {r["score"]}</div>', unsafe_allow_html=True)
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Stars", r['meta']['stars'])
+            with col2:
+                st.metric("Forks", r['meta']['forks'])
+            with col3:
+                st.metric("README", f"{readme_length(r['meta'])} chars")
+            
+            st.markdown("*Languages*")
+            st.markdown(skill_tags_html(r['meta']['languages']), unsafe_allow_html=True)
+
+            with st.expander("README"):
+                # Size mode only keeps the README size; fetch the text when asked
+                if r['meta'].get("readme_truncated"):
+                    if r['meta']['readme']:
+                        st.text(r['meta']['readme'] + " ...")
+                    if st.button("Load full README", key=f"readme_{r['repo']}"):
+                        try:
+                            load_full_readme(profile["username"], r['meta'])
+                        except Exception as e:
+                            st.error(f"Could not load README: {str(e)}")
+                        else:
+                            st.rerun()
+                else:
+                    st.text(r['meta']['readme'] or "No README")
+            
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        render_export(profile["rows"], "github_profile", "github_analysis")
+
+    with st.expander("Analyze a Shortlist"):
+        shortlist_text = st.text_area(
+            "GitHub usernames or resume text",
+            placeholder="One username per line, or paste resume text containing github.com/<user> links",
+        )
+
+        shown = False
+        if st.button("Analyze Shortlist", use_container_width=True):
+            usernames = extract_github_usernames(shortlist_text) or dedupe_usernames(shortlist_text.replace(",", " ").split())
+
+            if not usernames:
+                st.error("No GitHub usernames found")
+            else:
+                progress = st.progress(0.0, text=f"Analyzing {len(usernames)} profiles...")
+                table = st.empty()
+                batch_results = []
+                rows = []
+
+                for i, r in enumerate(iter_github_batch(usernames, max_requests=BATCH_MAX_REQUESTS), start=1):
+                    batch_results.append(r)
+                    rows.append(shortlist_row(r))
+                    table.dataframe(rows, use_container_width=True)
+                    progress.progress(i / len(usernames), text=f"Analyzed {i}/{len(usernames)} profiles")
+
+                st.session_state["github_shortlist"] = batch_results
+                shown = True
+
+        batch_results = st.session_state.get("github_shortlist")
+        if batch_results:
+            if not shown:
+                st.dataframe([shortlist_row(r) for r in batch_results], use_container_width=True)
+            render_export(batch_results, "github_shortlist", "github_shortlist")
+
 
 # Footer
 st.markdown('<p style="text-align: center; color: #999; padding: 1rem 0; font-size: 0.85rem; border-top: 1px solid #eee; margin-top: 1.5rem;">AI-Powered Recruitment Platform</p>', unsafe_allow_html=True)
@@ -0,0 +1,66 @@
+# bench_embedding_service.py
+#
+# Concurrent embedding throughput: every caller encoding its own batch of one
+# vs the shared micro-batcher, across a few batching settings.
+#
+#   python bench_embedding_service.py --texts 2000 --threads 16
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from embedding_service import MicroBatcher
+from jd_pdf_parser import embed_model
+
+SAMPLE = (
+    "Design and build scalable backend services in Python and Go, deploy them on "
+    "Kubernetes and monitor production systems used by millions of customers. {i}"
+)
+
+
+def run(encode_one, texts, threads):
+    latencies = []
+
+    def call(text):
+        start = time.perf_counter()
+        encode_one(text)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(call, texts))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "texts_per_s": len(texts) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Micro-batching embedding benchmark")
+    ap.add_argument("--texts", type=int, default=2000)
+    ap.add_argument("--threads", type=int, default=16)
+    args = ap.parse_args()
+
+    texts = [SAMPLE.format(i=i) for i in range(args.texts)]
+    embed_model.encode(texts[:8])  # warm-up
+
+    print(f"{args.texts} texts from {args.threads} threads\n")
+    print(f"{'mode':<26} {'texts/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'mean batch':>11}")
+
+    r = run(lambda t: embed_model.encode([t]), texts, args.threads)
+    print(f"{'batch of one':<26} {r['texts_per_s']:>9.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {1:>11}")
+
+    for max_batch, max_wait_ms in ((16, 2), (32, 5), (64, 10)):
+        batcher = MicroBatcher(embed_model, max_batch=max_batch, max_wait_ms=max_wait_ms)
+        r = run(lambda t: batcher.submit(t).result(), texts, args.threads)
+        label = f"batcher {max_batch} / {max_wait_ms} ms"
+        print(f"{label:<26} {r['texts_per_s']:>9.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} "
+              f"{batcher.stats()['mean_batch']:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# bench_records_memory.py
+#
+# Memory held by N parsed + matched candidates: the parser's plain dicts
+# (embedding as a list of floats) vs records.py (slotted records, float32
+# embedding, interned skills, match -> resume by reference). Synthetic data,
+# no model needed.
+#
+#   python bench_records_memory.py --candidates 50000
+
+import argparse
+import gc
+import random
+import tracemalloc
+
+import numpy as np
+
+from records import ResumeRecord, MatchRecord
+
+EMBEDDING_DIM = 384  # paraphrase-MiniLM-L3-v2
+SKILLS = ["Python", "Java", "SQL", "Docker", "Kubernetes", "AWS", "React", "Node", "Django", "Flask",
+          "Azure", "GCP", "REST API", "TensorFlow", "PyTorch", "C++", "HTML", "CSS", "Android", "Go"]
+JD_SKILLS = SKILLS[:8]
+
+
+def fresh(s):
+    # A new str object, as regex / split output would be (not interned)
+    return (s + " ")[:-1]
+
+
+def make_pair(i, rnd, text_chars):
+    skills = [fresh(s) for s in rnd.sample(SKILLS, 12)]
+    resume = {
+        "cleaned_text": f"Candidate {i} " + "x" * text_chars,
+        "skills": skills,
+        "responsibilities": [f"Built service {i}.{k} used by many customers" for k in range(3)],
+        "seniority_level": "Not Specified",
+        "tech_stack": skills[:6],
+        "keywords": [fresh(s) for s in skills[:8]],
+        "domain": "General",
+        "location": "Bangalore",
+        "embedding": np.random.default_rng(i).random(EMBEDDING_DIM).tolist(),
+        "candidate_name": f"Candidate {i}",
+        "path": f"resume_{i}.pdf",
+    }
+    lowered = {s.lower() for s in skills}
+    score = rnd.random()
+    match = {
+        "candidate_name": resume["candidate_name"],
+        "path": resume["path"],
+        "skills": resume["skills"],
+        "matched_skills": sorted(s.lower() for s in JD_SKILLS if s.lower() in lowered),
+        "missing_skills": sorted(s.lower() for s in JD_SKILLS if s.lower() not in lowered),
+        "skill_score": score,
+        "embed_score": score,
+        "resp_score": score,
+        "final_score": score,
+        "source_url": f"https://example.com/resume_{i}.pdf",
+        "cleaned_text": resume["cleaned_text"],
+    }
+    return resume, match
+
+
+def measure(build, n, text_chars):
+    gc.collect()
+    tracemalloc.start()
+    held = build(n, text_chars)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return current
+
+
+def build_dicts(n, text_chars):
+    rnd = random.Random(0)
+    return [make_pair(i, rnd, text_chars) for i in range(n)]
+
+
+def build_records(n, text_chars):
+    rnd = random.Random(0)
+    out = []
+    for i in range(n):
+        resume, match = make_pair(i, rnd, text_chars)
+        rec = ResumeRecord.from_dict(resume)
+        out.append(MatchRecord.from_dict(match, rec))
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Candidate record memory benchmark")
+    ap.add_argument("--candidates", type=int, default=50000)
+    ap.add_argument("--text-chars", type=int, default=2000, help="resume text length")
+    args = ap.parse_args()
+
+    text_mb = args.candidates * args.text_chars / 1024 / 1024
+    print(f"{args.candidates} candidates, {args.text_chars}-char resumes (~{text_mb:.0f} MB of text)\n")
+    print(f"{'representation':<16} {'total MB':>9} {'per candidate KB':>17}")
+
+    for name, build in (("dicts", build_dicts), ("records", build_records)):
+        total = measure(build, args.candidates, args.text_chars)
+        print(f"{name:<16} {total / 1024 / 1024:>9.1f} {total / args.candidates / 1024:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
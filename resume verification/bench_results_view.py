@@ -0,0 +1,98 @@
+# bench_results_view.py
+#
+# Script run time and element count for rendering N resume results: the old
+# per-tag st.markdown cards for every candidate vs results_view (score table
+# + one HTML block per card, visible page only). Runs headless via AppTest.
+#
+#   python bench_results_view.py --candidates 500
+
+import argparse
+import random
+import statistics
+import time
+
+from streamlit.testing.v1 import AppTest
+
+SKILLS = ["Python", "Java", "SQL", "Docker", "Kubernetes", "AWS", "React", "Node", "Django", "Flask",
+          "Azure", "GCP", "REST", "API", "TensorFlow", "PyTorch", "C++", "HTML", "CSS", "Android"]
+
+
+def make_results(n, seed=0):
+    rnd = random.Random(seed)
+    results = []
+    for i in range(n):
+        skills = rnd.sample(SKILLS, 12)
+        results.append({
+            "candidate_name": f"Candidate {i}",
+            "final_score": rnd.random(),
+            "source_url": f"https://example.com/resume_{i}.pdf",
+            "matched_skills": skills[:6],
+            "missing_skills": skills[6:],
+            "cleaned_text": "lorem ipsum " * 200,
+        })
+    results.sort(key=lambda r: r["final_score"], reverse=True)
+    return results
+
+
+def legacy_view(results):
+    import streamlit as st
+
+    for r in results:
+        st.markdown('<div class="candidate-card">', unsafe_allow_html=True)
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.markdown(f"{r['candidate_name']}")
+        with col2:
+            st.markdown(f'<div class="score-badge">Match Score: {r["final_score"]:.1%}</div>', unsafe_allow_html=True)
+        st.markdown(f"[View Source]({r['source_url']})")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("*Matched Skills*")
+            for skill in r["matched_skills"]:
+                st.markdown(f'<span class="skill-tag">{skill}</span>', unsafe_allow_html=True)
+        with col2:
+            st.markdown("*Missing Skills*")
+            for skill in r["missing_skills"]:
+                st.markdown(f'<span class="missing-skill-tag">{skill}</span>', unsafe_allow_html=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+
+def paged_view(results):
+    from results_view import render_resume_results
+
+    render_resume_results(results, show_text=False)
+
+
+def count_elements(node):
+    children = getattr(node, "children", None) or {}
+    return 1 + sum(count_elements(c) for c in children.values())
+
+
+def bench(view, results, runs):
+    times = []
+    for _ in range(runs):
+        at = AppTest.from_function(view, args=(results,), default_timeout=120)
+        start = time.perf_counter()
+        at.run()
+        times.append((time.perf_counter() - start) * 1000)
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+    return statistics.median(times), count_elements(at._tree)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Results view render benchmark")
+    ap.add_argument("--candidates", type=int, default=500)
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args()
+
+    results = make_results(args.candidates)
+    print(f"Rendering {args.candidates} candidates (median of {args.runs} runs)\n")
+    print(f"{'view':<22} {'render ms':>10} {'elements':>9}")
+    for name, view in (("per-tag cards", legacy_view), ("table + paged cards", paged_view)):
+        ms, elements = bench(view, results, args.runs)
+        print(f"{name:<22} {ms:>10.0f} {elements:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+# cert_path.py
+#
+# The certificate pipeline, and the OCR engine both apps share, live in the
+# sibling "certificate verification" folder. Folder names have spaces, so
+# it is reached through sys.path rather than as a package.
+
+import os
+import sys
+
+CERT_DIR = os.path.normpath(os.getenv(
+    "CERT_VERIFICATION_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "certificate verification"),
+))
+
+
+def add_cert_dir():
+    if CERT_DIR not in sys.path:
+        sys.path.append(CERT_DIR)
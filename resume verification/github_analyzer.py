@@ -4,6 +4,8 @@ import re
 from dotenv import load_dotenv
 import os
 
+from github_client import github_get, github_post, GitHubRateLimitError, GitHubBudgetExceeded
+
 # --------------------------------
 # LOAD GITHUB TOKEN
 # --------------------------------
@@ -14,6 +16,29 @@ HEADERS = {}
 if GITHUB_TOKEN:
     HEADERS = {"Authorization": f"token {GITHUB_TOKEN}"}
 
+# Point both backends at a local fake server by overriding the base URL.
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com").rstrip("/")
+GITHUB_GRAPHQL_URL = os.getenv("GITHUB_GRAPHQL_URL", f"{GITHUB_API_URL}/graphql")
+
+# "auto" uses GraphQL when a token is set (GraphQL requires auth) and
+# falls back to REST on any GraphQL failure; "graphql" / "rest" force one.
+GITHUB_BACKEND = os.getenv("GITHUB_BACKEND", "auto").lower()
+GRAPHQL_PAGE_SIZE = 50
+
+# "full" downloads and cleans every README; "size" scores from the README
+# blob size and keeps at most README_PREFIX_CHARS of cleaned text.
+README_MODE = os.getenv("GITHUB_README_MODE", "full").lower()
+README_PREFIX_CHARS = int(os.getenv("GITHUB_README_PREFIX_CHARS", "0"))
+
+
+class GitHubGraphQLError(RuntimeError):
+    pass
+
+
+class GitHubNotFound(ValueError):
+    """The user does not exist or has no public repositories."""
+
+
 # --------------------------------
 # CLEAN README
 # --------------------------------
@@ -28,13 +53,21 @@ def clean_readme(text):
 # --------------------------------
 # SCORE FUNCTION
 # --------------------------------
+def readme_length(meta):
+    # In "size" mode only a prefix is kept, so the raw blob size stands in
+    # for the cleaned length (slightly larger because markup is counted).
+    if meta.get("readme_truncated"):
+        return meta.get("readme_size", 0)
+    return len(meta["readme"])
+
+
 def compute_repo_score(meta):
     score = 0
     score += min(meta["stars"], 50) * 0.5
     score += min(meta["forks"], 20) * 0.3
     score += 5 if meta["open_issues"] == 0 else 2
 
-    readme_len = len(meta["readme"])
+    readme_len = readme_length(meta)
     if readme_len > 2000: score += 15
     elif readme_len > 1000: score += 10
     elif readme_len > 300: score += 5
@@ -49,14 +82,21 @@ def compute_repo_score(meta):
 # --------------------------------
 # FETCH README
 # --------------------------------
-def fetch_readme(username, repo):
-    url = f"https://api.github.com/repos/{username}/{repo}/readme"
-    res = requests.get(url, headers=HEADERS)
+def fetch_readme_json(username, repo):
+    url = f"{GITHUB_API_URL}/repos/{username}/{repo}/readme"
+    res = github_get(url, headers=HEADERS)
 
     if res.status_code != 200:
+        return None
+    return res.json()
+
+
+def fetch_readme(username, repo):
+    data = fetch_readme_json(username, repo)
+    if not data:
         return ""
 
-    content = res.json().get("content", "")
+    content = data.get("content", "")
     try:
         decoded = base64.b64decode(content).decode("utf-8", errors="ignore")
         return clean_readme(decoded)
@@ -64,12 +104,44 @@ def fetch_readme(username, repo):
         return ""
 
 
+def decode_readme_prefix(content, max_chars):
+    # Only decode enough base64 (4 chars -> 3 bytes) for the prefix
+    needed = (max_chars + 2) // 3 * 4
+    b64 = "".join(content[:needed + needed // 60 + 2].split())[:needed]
+    b64 = b64[:len(b64) - len(b64) % 4]
+    try:
+        decoded = base64.b64decode(b64).decode("utf-8", errors="ignore")
+    except:
+        return ""
+    return clean_readme(decoded)[:max_chars]
+
+
+def fetch_readme_summary(username, repo, prefix_chars=README_PREFIX_CHARS):
+    """README size in bytes plus an optional cleaned prefix, without decoding the whole file."""
+    data = fetch_readme_json(username, repo)
+    if not data:
+        return "", 0
+
+    prefix = ""
+    if prefix_chars > 0:
+        prefix = decode_readme_prefix(data.get("content", ""), prefix_chars)
+    return prefix, data.get("size", 0)
+
+
+def load_full_readme(username, meta):
+    """Replace a size-only README entry with the full cleaned text (on demand)."""
+    if meta.get("readme_truncated"):
+        meta["readme"] = fetch_readme(username, meta["name"])
+        meta["readme_truncated"] = False
+    return meta["readme"]
+
+
 # --------------------------------
 # FETCH LANGUAGES
 # --------------------------------
 def fetch_languages(username, repo):
-    url = f"https://api.github.com/repos/{username}/{repo}/languages"
-    res = requests.get(url, headers=HEADERS)
+    url = f"{GITHUB_API_URL}/repos/{username}/{repo}/languages"
+    res = github_get(url, headers=HEADERS)
 
     if res.status_code != 200:
         return []
@@ -83,8 +155,10 @@ def fetch_repo_files_recursive(api_url):
     code_files = []
 
     try:
-        res = requests.get(api_url, headers=HEADERS)
+        res = github_get(api_url, headers=HEADERS)
         items = res.json()
+    except (GitHubRateLimitError, GitHubBudgetExceeded):
+        raise
     except:
         return []
 
@@ -104,7 +178,7 @@ def fetch_repo_files_recursive(api_url):
 
 
 def fetch_repo_files(username, repo):
-    api_url = f"https://api.github.com/repos/{username}/{repo}/contents"
+    api_url = f"{GITHUB_API_URL}/repos/{username}/{repo}/contents"
     return fetch_repo_files_recursive(api_url)
 
 
@@ -113,7 +187,8 @@ def fetch_repo_files(username, repo):
 # --------------------------------
 def download_raw_code(url):
     try:
-        r = requests.get(url, headers=HEADERS)
+        # Raw files use no API quota; caching them would only grow the disk cache
+        r = github_get(url, headers=HEADERS, resource=None, cache=False)
         if r.status_code == 200:
             return r.text
     except:
@@ -153,27 +228,174 @@ def extract_skills_from_code(code_text):
 
 
 # --------------------------------
-# MAIN PROFILE ANALYSIS
+# REST BACKEND (3 requests per repo)
 # --------------------------------
-def analyze_github_profile(username):
-    url = f"https://api.github.com/users/{username}/repos"
-    res = requests.get(url, headers=HEADERS)
+def fetch_repos_rest(username, readme_mode=None):
+    readme_mode = readme_mode or README_MODE
 
+    url = f"{GITHUB_API_URL}/users/{username}/repos"
+    res = github_get(url, headers=HEADERS)
+
+    if res.status_code == 404:
+        raise GitHubNotFound(f"GitHub user '{username}' not found.")
     if res.status_code != 200:
-        raise ValueError("Invalid username or GitHub API rate limit reached.")
+        raise ValueError(f"GitHub API error {res.status_code} while listing repositories.")
 
-    repos = res.json()
+    repos = []
+    for repo in res.json():
+        repo_name = repo["name"]
+        meta = {
+            "name": repo_name,
+            "stars": repo["stargazers_count"],
+            "forks": repo["forks_count"],
+            "open_issues": repo["open_issues_count"],
+            "languages": fetch_languages(username, repo_name),
+        }
+
+        if readme_mode == "size":
+            prefix, size = fetch_readme_summary(username, repo_name)
+            meta.update(readme=prefix, readme_size=size, readme_truncated=True)
+        else:
+            meta["readme"] = fetch_readme(username, repo_name)
+
+        repos.append(meta)
+    return repos
+
+
+# --------------------------------
+# GRAPHQL BACKEND (1 request per page of repos)
+# --------------------------------
+REPOS_QUERY = """
+query($login: String!, $first: Int!, $cursor: String) {
+  repositoryOwner(login: $login) {
+    repositories(first: $first, after: $cursor, ownerAffiliations: OWNER,
+                 privacy: PUBLIC, orderBy: {field: NAME, direction: ASC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        stargazerCount
+        forkCount
+        issues(states: OPEN) { totalCount }
+        pullRequests(states: OPEN) { totalCount }
+        languages(first: 20, orderBy: {field: SIZE, direction: DESC}) { nodes { name } }
+        readmeMd: object(expression: "HEAD:README.md") { ... on Blob { %(blob)s } }
+        readmeLower: object(expression: "HEAD:readme.md") { ... on Blob { %(blob)s } }
+        readmeRst: object(expression: "HEAD:README.rst") { ... on Blob { %(blob)s } }
+        readmePlain: object(expression: "HEAD:README") { ... on Blob { %(blob)s } }
+      }
+    }
+  }
+}
+"""
+
+README_ALIASES = ("readmeMd", "readmeLower", "readmeRst", "readmePlain")
+
+
+def graphql_query(query, variables):
+    res = github_post(
+        GITHUB_GRAPHQL_URL,
+        {"query": query, "variables": variables},
+        headers=HEADERS,
+    )
+    if res.status_code != 200:
+        raise GitHubGraphQLError(f"GraphQL HTTP {res.status_code}")
+
+    body = res.json()
+    if body.get("errors"):
+        raise GitHubGraphQLError(body["errors"][0].get("message", "GraphQL error"))
+    return body["data"]
+
+
+def repos_query(readme_mode):
+    # Leaving out `text` is what keeps size mode cheap: GitHub never sends the blobs
+    with_text = readme_mode != "size" or README_PREFIX_CHARS > 0
+    return REPOS_QUERY % {"blob": "byteSize text" if with_text else "byteSize"}
+
+
+def graphql_repo_meta(node, readme_mode):
+    readme = ""
+    readme_size = 0
+    for alias in README_ALIASES:
+        blob = node.get(alias)
+        if blob:
+            readme = clean_readme(blob.get("text") or "")
+            readme_size = blob.get("byteSize") or 0
+            break
+
+    meta = {
+        "name": node["name"],
+        "stars": node["stargazerCount"],
+        "forks": node["forkCount"],
+        # REST open_issues_count includes open pull requests
+        "open_issues": node["issues"]["totalCount"] + node["pullRequests"]["totalCount"],
+        "languages": [l["name"] for l in node["languages"]["nodes"]],
+        "readme": readme,
+        "readme_size": readme_size,
+    }
+    if readme_mode == "size":
+        meta["readme"] = readme[:README_PREFIX_CHARS]
+        meta["readme_truncated"] = True
+    return meta
+
+
+def fetch_repos_graphql(username, readme_mode=None):
+    if not GITHUB_TOKEN:
+        raise GitHubGraphQLError("GraphQL API requires GITHUB_TOKEN.")
+
+    readme_mode = readme_mode or README_MODE
+    query = repos_query(readme_mode)
+    repos = []
+    cursor = None
+    while True:
+        data = graphql_query(query, {
+            "login": username,
+            "first": GRAPHQL_PAGE_SIZE,
+            "cursor": cursor,
+        })
+
+        owner = data.get("repositoryOwner")
+        if owner is None:
+            raise GitHubNotFound(f"GitHub user '{username}' not found.")
+
+        page = owner["repositories"]
+        repos.extend(graphql_repo_meta(n, readme_mode) for n in page["nodes"])
+
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        cursor = page["pageInfo"]["endCursor"]
+
+    return repos
+
+
+def fetch_repos(username, backend=None, readme_mode=None):
+    backend = (backend or GITHUB_BACKEND).lower()
+
+    if backend == "rest":
+        return fetch_repos_rest(username, readme_mode)
+    if backend == "graphql":
+        return fetch_repos_graphql(username, readme_mode)
+
+    if GITHUB_TOKEN:
+        try:
+            return fetch_repos_graphql(username, readme_mode)
+        except (GitHubGraphQLError, GitHubRateLimitError, requests.RequestException) as e:
+            print(f"[GitHub GraphQL] {e} - falling back to REST")
+    return fetch_repos_rest(username, readme_mode)
+
+
+# --------------------------------
+# MAIN PROFILE ANALYSIS
+# --------------------------------
+def analyze_github_profile(username, backend=None, readme_mode=None):
+    repos = fetch_repos(username, backend, readme_mode)
     if len(repos) == 0:
-        raise ValueError("No public repositories found.")
+        raise GitHubNotFound("No public repositories found.")
 
     profile_score = 0
     detailed_results = []
 
-    for repo in repos:
-        repo_name = repo["name"]
-
-        readme = fetch_readme(username, repo_name)
-        languages = fetch_languages(username, repo_name)
+    for meta in repos:
+        repo_name = meta["name"]
 
         file_urls = fetch_repo_files(username, repo_name)
         code_skills = set()
@@ -182,15 +404,7 @@ def analyze_github_profile(username):
             code_text = download_raw_code(file_url)
             code_skills.update(extract_skills_from_code(code_text))
 
-        meta = {
-            "name": repo_name,
-            "stars": repo["stargazers_count"],
-            "forks": repo["forks_count"],
-            "open_issues": repo["open_issues_count"],
-            "languages": languages,
-            "readme": readme,
-            "code_skills": list(code_skills)
-        }
+        meta["code_skills"] = list(code_skills)
 
         repo_score = compute_repo_score(meta)
         profile_score += repo_score
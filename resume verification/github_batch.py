@@ -0,0 +1,130 @@
+# github_batch.py
+
+import argparse
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from github_analyzer import analyze_github_profile
+from github_client import RequestBudget, rate_limit_status, use_budget
+
+# Default GitHub request cap for one shortlist run in the app (the CLI
+# takes --max-requests); keeps one large paste from draining the hourly quota
+BATCH_MAX_REQUESTS = int(os.getenv("GITHUB_BATCH_MAX_REQUESTS", "500"))
+
+# github.com paths that are not user profiles
+RESERVED_PATHS = {
+    "about", "apps", "collections", "contact", "customer-stories", "enterprise",
+    "events", "explore", "features", "login", "marketplace", "orgs", "pricing",
+    "security", "settings", "signup", "site", "sponsors", "topics", "trending",
+}
+
+GITHUB_LINK_RE = re.compile(
+    r"github\.com/([A-Za-z0-9](?:[A-Za-z0-9]|-(?=[A-Za-z0-9])){0,38})(?![A-Za-z0-9-])",
+    re.IGNORECASE,
+)
+
+
+# ---------------------------------------------------------------------------
+# USERNAME EXTRACTION (from parsed resume text)
+# ---------------------------------------------------------------------------
+def extract_github_usernames(text):
+    found = []
+    for m in GITHUB_LINK_RE.finditer(text or ""):
+        user = m.group(1)
+        if user.lower() not in RESERVED_PATHS:
+            found.append(user)
+    return dedupe_usernames(found)
+
+
+def dedupe_usernames(usernames):
+    # GitHub logins are case-insensitive; keep the first spelling seen
+    seen = {}
+    for u in usernames:
+        u = u.strip().lstrip("@")
+        if u and u.lower() not in seen:
+            seen[u.lower()] = u
+    return list(seen.values())
+
+
+# ---------------------------------------------------------------------------
+# CONCURRENT ANALYSIS
+# ---------------------------------------------------------------------------
+def _analyze_one(username, backend, budget=None):
+    try:
+        with use_budget(budget):
+            score, repos = analyze_github_profile(username, backend)
+        return {"username": username, "score": score, "repos": repos, "error": None}
+    except Exception as e:
+        return {"username": username, "score": None, "repos": [], "error": str(e)}
+
+
+def iter_github_batch(usernames, max_workers=4, max_requests=None, backend=None):
+    """
+    Analyze many profiles concurrently, yielding one result per user as it
+    finishes. max_requests caps GitHub API calls across all users; once it
+    is spent the remaining users come back with an error instead of a score.
+    All workers share the same on-disk ETag cache, so repos fetched for one
+    user (or an earlier run) are revalidated for free.
+    """
+    usernames = dedupe_usernames(usernames)
+
+    # This batch's own counter; other batches running at the same time are unaffected
+    budget = RequestBudget(max_requests) if max_requests is not None else None
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_analyze_one, u, backend, budget) for u in usernames]
+        for fut in as_completed(futures):
+            yield fut.result()
+
+
+def analyze_github_batch(usernames, out_path, max_workers=4, max_requests=None,
+                         backend=None, on_result=None):
+    """Stream results to a JSONL file (one line per user) and return them."""
+    results = []
+    with open(out_path, "w", encoding="utf-8") as f:
+        for result in iter_github_batch(usernames, max_workers, max_requests, backend):
+            f.write(json.dumps(result) + "\n")
+            f.flush()
+            results.append(result)
+            if on_result:
+                on_result(result)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Analyze a shortlist of GitHub profiles.")
+    ap.add_argument("usernames", nargs="*", help="GitHub usernames")
+    ap.add_argument("--from-text", nargs="*", default=[], metavar="FILE",
+                    help="text files (e.g. parsed resumes) to scan for github.com/<user> links")
+    ap.add_argument("--out", default="github_batch.jsonl")
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--max-requests", type=int, default=None)
+    ap.add_argument("--backend", choices=["auto", "graphql", "rest"], default=None)
+    args = ap.parse_args(argv)
+
+    usernames = list(args.usernames)
+    for path in args.from_text:
+        with open(path, encoding="utf-8", errors="ignore") as f:
+            usernames.extend(extract_github_usernames(f.read()))
+
+    if not usernames:
+        ap.error("no usernames given or found")
+
+    def report(r):
+        status = f"score {r['score']}" if r["error"] is None else f"error: {r['error']}"
+        print(f"{r['username']}: {status}")
+
+    analyze_github_batch(usernames, args.out, args.workers, args.max_requests,
+                         args.backend, on_result=report)
+
+    print(f"\nResults written to {args.out}")
+    print(f"GitHub quota: {rate_limit_status()['quota']}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
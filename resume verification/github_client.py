@@ -0,0 +1,308 @@
+# github_client.py
+
+import contextvars
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import requests
+from dotenv import load_dotenv
+
+load_dotenv()
+
+CACHE_DIR = Path(os.getenv("GITHUB_CACHE_DIR", "github_cache"))
+
+# Size bound for the ETag cache; least recently used entries are evicted
+# down to CACHE_EVICT_TARGET of it, checking every CACHE_EVICT_EVERY writes.
+CACHE_MAX_BYTES = int(float(os.getenv("GITHUB_CACHE_MAX_MB", "64")) * 1024 * 1024)
+CACHE_EVICT_TARGET = 0.9
+CACHE_EVICT_EVERY = 50
+
+# Stop issuing unconditional requests when this many calls are left, so
+# conditional (ETag) revalidations can still go through.
+RATE_LIMIT_RESERVE = int(os.getenv("GITHUB_RATE_LIMIT_RESERVE", "5"))
+
+# Requests are deferred until the window resets if that is at most this
+# many seconds away; otherwise GitHubRateLimitError is raised right away.
+MAX_RATE_LIMIT_WAIT = float(os.getenv("GITHUB_MAX_RATE_LIMIT_WAIT", "60"))
+
+
+class GitHubRateLimitError(RuntimeError):
+    def __init__(self, resource, reset_at):
+        self.resource = resource
+        self.reset_at = reset_at
+        when = time.strftime("%H:%M:%S", time.localtime(reset_at)) if reset_at else "unknown"
+        super().__init__(f"GitHub API rate limit reached ({resource}); resets at {when}.")
+
+
+class GitHubBudgetExceeded(RuntimeError):
+    pass
+
+
+# ---------------------------------------------------------------------------
+# PER-BATCH REQUEST BUDGET
+# ---------------------------------------------------------------------------
+class RequestBudget:
+    """
+    Cap on API requests for one batch run, shared only by that batch's threads.
+    Only requests that count against the GitHub quota are charged; 304
+    revalidations are free.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def check(self):
+        with self._lock:
+            if self.used >= self.limit:
+                raise GitHubBudgetExceeded("GitHub request budget exhausted.")
+
+    def charge(self):
+        with self._lock:
+            self.used += 1
+
+    @property
+    def left(self):
+        return self.limit - self.used
+
+
+# Context-local, so overlapping batches (e.g. two Streamlit sessions) each
+# spend their own budget. Worker threads enter it with use_budget().
+_current_budget = contextvars.ContextVar("github_request_budget", default=None)
+
+
+@contextmanager
+def use_budget(budget):
+    token = _current_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_budget.reset(token)
+
+
+# ---------------------------------------------------------------------------
+# RATE-LIMIT SCHEDULER
+# ---------------------------------------------------------------------------
+class RateLimitScheduler:
+    """Tracks X-RateLimit-* per resource and holds requests back before the quota runs out."""
+
+    def __init__(self, reserve=RATE_LIMIT_RESERVE, max_wait=MAX_RATE_LIMIT_WAIT):
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.quota = {}
+        self.stats = {"requests": 0, "not_modified": 0, "deferred_seconds": 0.0}
+        self._cond = threading.Condition()
+
+    def acquire(self, resource, conditional=False):
+        """
+        Wait until resource has quota to spare. Nothing is charged here;
+        update() does that once the response shows whether it counted.
+        Conditional requests are let through an exhausted batch budget
+        since they usually come back 304.
+        """
+        floor = 0 if conditional else self.reserve
+
+        budget = _current_budget.get()
+        if budget is not None and not conditional:
+            budget.check()
+
+        with self._cond:
+            while True:
+                q = self.quota.get(resource)
+                now = time.time()
+
+                if not q or q["remaining"] > floor or now >= q["reset"]:
+                    self.stats["requests"] += 1
+                    return
+
+                wait = q["reset"] - now
+                if wait > self.max_wait:
+                    raise GitHubRateLimitError(resource, q["reset"])
+
+                # Other threads queue on the same condition until the reset
+                self.stats["deferred_seconds"] += wait
+                self._cond.wait(timeout=wait + 1)
+
+    def update(self, resource, res):
+        """Record a response: charge the batch budget and quota unless it was a 304."""
+        counted = res.status_code != 304
+        budget = _current_budget.get()
+        if budget is not None and counted:
+            budget.charge()
+
+        h = res.headers
+        with self._cond:
+            if not counted:
+                self.stats["not_modified"] += 1
+
+            if "X-RateLimit-Remaining" in h:
+                resource = h.get("X-RateLimit-Resource", resource)
+                self.quota[resource] = {
+                    "limit": int(h.get("X-RateLimit-Limit", 0)),
+                    "remaining": int(h["X-RateLimit-Remaining"]),
+                    "used": int(h.get("X-RateLimit-Used", 0)),
+                    "reset": int(h.get("X-RateLimit-Reset", 0)),
+                }
+            elif counted and resource in self.quota:
+                self.quota[resource]["remaining"] -= 1
+            self._cond.notify_all()
+
+    def status(self):
+        with self._cond:
+            return {
+                "quota": {r: dict(q) for r, q in self.quota.items()},
+                **self.stats,
+            }
+
+
+scheduler = RateLimitScheduler()
+
+
+def rate_limit_status():
+    return scheduler.status()
+
+
+# ---------------------------------------------------------------------------
+# ETAG CACHE (one file per URL: JSON header line + raw body)
+# ---------------------------------------------------------------------------
+def _cache_path(url):
+    return CACHE_DIR / (hashlib.sha256(url.encode("utf-8")).hexdigest() + ".cache")
+
+
+def load_cached(url):
+    path = _cache_path(url)
+    try:
+        with open(path, "rb") as f:
+            meta_line, body = f.read().split(b"\n", 1)
+        meta = json.loads(meta_line)
+    except (OSError, ValueError):
+        return None, None
+    try:
+        os.utime(path)  # mark as recently used
+    except OSError:
+        pass
+    return meta, body
+
+
+_stores = 0
+_stores_lock = threading.Lock()
+
+
+def evict_cache(max_bytes=None):
+    max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    entries = []
+    total = 0
+    for path in CACHE_DIR.glob("*.cache"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+        total += st.st_size
+
+    if total <= max_bytes:
+        return 0
+
+    removed = 0
+    target = max_bytes * CACHE_EVICT_TARGET
+    for _, size, path in sorted(entries):
+        if total <= target:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def store_cached(url, res):
+    meta = {
+        "url": url,
+        "etag": res.headers.get("ETag"),
+        "last_modified": res.headers.get("Last-Modified"),
+        "content_type": res.headers.get("Content-Type", ""),
+    }
+    if not meta["etag"] and not meta["last_modified"]:
+        return
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = _cache_path(url)
+    tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(json.dumps(meta).encode("utf-8") + b"\n" + res.content)
+    os.replace(tmp, path)
+
+    global _stores
+    with _stores_lock:
+        check = _stores % CACHE_EVICT_EVERY == 0
+        _stores += 1
+    if check:
+        evict_cache()
+
+
+def _replay(url, meta, body):
+    res = requests.Response()
+    res.url = url
+    res.status_code = 200
+    res._content = body
+    res.headers["Content-Type"] = meta.get("content_type", "")
+    res.encoding = "utf-8"
+    res.from_cache = True
+    return res
+
+
+def _check_rate_limited(resource, res):
+    if res.status_code in (403, 429) and res.headers.get("X-RateLimit-Remaining") == "0":
+        raise GitHubRateLimitError(resource, int(res.headers.get("X-RateLimit-Reset", 0)))
+
+
+# ---------------------------------------------------------------------------
+# REQUEST HELPERS
+# ---------------------------------------------------------------------------
+def github_get(url, headers=None, resource="core", timeout=30, cache=True):
+    """
+    GET with If-None-Match / If-Modified-Since replay. A 304 is answered
+    from the on-disk cache and does not count against the quota.
+    Pass resource=None for hosts without rate-limit headers (raw files),
+    and cache=False for bodies not worth keeping on disk.
+    """
+    meta, body = load_cached(url) if cache else (None, None)
+    req_headers = dict(headers or {})
+    if meta:
+        if meta.get("etag"):
+            req_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            req_headers["If-Modified-Since"] = meta["last_modified"]
+
+    if resource:
+        scheduler.acquire(resource, conditional=meta is not None)
+
+    res = requests.get(url, headers=req_headers, timeout=timeout)
+
+    if resource:
+        scheduler.update(resource, res)
+        _check_rate_limited(resource, res)
+
+    if res.status_code == 304 and meta:
+        return _replay(url, meta, body)
+
+    res.from_cache = False
+    if res.status_code == 200 and cache:
+        store_cached(url, res)
+    return res
+
+
+def github_post(url, json_body, headers=None, resource="graphql", timeout=30):
+    scheduler.acquire(resource)
+    res = requests.post(url, json=json_body, headers=headers or {}, timeout=timeout)
+    scheduler.update(resource, res)
+    _check_rate_limited(resource, res)
+    return res
@@ -1,17 +1,19 @@
 # google_finder.py
 
+import io
 import os
 import requests
-from pathlib import Path
 from urllib.parse import urlparse
 from dotenv import load_dotenv
 from time import sleep
 
+from records import final_score
+
 load_dotenv()
 
 SERPER_KEY = os.getenv("SERPER_API_KEY")
-OUT_DIR = Path("downloaded_resumes")
-OUT_DIR.mkdir(exist_ok=True)
+# Resumes are kept in memory only; anything bigger than this is skipped
+MAX_DOWNLOAD_BYTES = int(float(os.getenv("RESUME_MAX_DOWNLOAD_MB", "10")) * 1024 * 1024)
 
 
 # ---------------------------------------------------------------------------
@@ -118,24 +120,30 @@ def extract_resume_urls(response_json):
 # DOWNLOAD FILE
 # ---------------------------------------------------------------------------
 def download_file(url):
+    """
+    Download into memory. Returns a BytesIO with .name set to the file
+    name, or None on failure; nothing is written to disk, so concurrent
+    sessions can't overwrite each other's files.
+    """
     filename = url.split("/")[-1]
 
     # if no filename, generate a safe one
     if not filename or "." not in filename:
         filename = f"resume_{abs(hash(url))}.pdf"
 
-    local_path = OUT_DIR / filename
-
     try:
         response = requests.get(url, stream=True, timeout=25)
         response.raise_for_status()
 
-        with open(local_path, "wb") as f:
-            for chunk in response.iter_content(1024 * 16):
-                if chunk:
-                    f.write(chunk)
+        buf = io.BytesIO()
+        for chunk in response.iter_content(1024 * 16):
+            buf.write(chunk)
+            if buf.tell() > MAX_DOWNLOAD_BYTES:
+                raise ValueError(f"larger than {MAX_DOWNLOAD_BYTES // (1024 * 1024)} MB")
 
-        return str(local_path)
+        buf.seek(0)
+        buf.name = filename
+        return buf
 
     except Exception as e:
         print(f"[Download Failed] {url} → {e}")
@@ -145,7 +153,20 @@ def download_file(url):
 # ---------------------------------------------------------------------------
 # FULL PIPELINE (core function)
 # ---------------------------------------------------------------------------
-def find_candidates_for_jd(jd_data, parse_and_score_fn, max_downloads=10):
+def find_candidates_for_jd(jd_data, parse_and_score_fn, max_downloads=10,
+                           on_progress=None, on_result=None, cancel_event=None):
+    """
+    on_progress(stage, done, total) and on_result(result) are called as the
+    search goes, so callers can show partial results; setting cancel_event
+    stops it after the current download and returns what was scored so far.
+    """
+    def progress(stage, done=0, total=0):
+        if on_progress:
+            on_progress(stage, done, total)
+
+    def cancelled():
+        return cancel_event is not None and cancel_event.is_set()
+
     jd_title = jd_data.get("title") or jd_data.get("job_title") or "Software Engineer"
     skills = jd_data.get("skills", []) or []
     domain = jd_data.get("domain", "") or ""
@@ -156,7 +177,10 @@ def find_candidates_for_jd(jd_data, parse_and_score_fn, max_downloads=10):
     all_urls = []
 
     print("\n====== SEARCHING GOOGLE ======")
-    for q in queries:
+    for i, q in enumerate(queries):
+        if cancelled():
+            return []
+        progress("Searching Google", i, len(queries))
         print(f"[QUERY] {q}")
         serper_json = serper_search(q)
         urls = extract_resume_urls(serper_json)
@@ -181,28 +205,33 @@ def find_candidates_for_jd(jd_data, parse_and_score_fn, max_downloads=10):
     print("\n====== DOWNLOADING & MATCHING RESUMES ======")
 
     for link in all_urls:
-        if downloaded >= max_downloads:
+        if downloaded >= max_downloads or cancelled():
             break
 
+        progress("Downloading and scoring resumes", downloaded, max_downloads)
         print(f"Downloading: {link}")
-        file_path = download_file(link)
+        resume_file = download_file(link)
 
-        if not file_path:
+        if not resume_file:
             continue
 
         try:
-            result_obj = parse_and_score_fn(file_path, jd_data, source_url=link)
+            result_obj = parse_and_score_fn(resume_file, jd_data, source_url=link)
             results.append(result_obj)
             downloaded += 1
+            if on_result:
+                on_result(result_obj)
 
             print(f" ✓ Parsed + scored candidate #{downloaded}")
 
         except Exception as e:
-            print(f"[Parse Error] {file_path}: {e}")
+            print(f"[Parse Error] {resume_file.name}: {e}")
 
         sleep(0.3)
 
+    progress("Done", downloaded, max_downloads)
+
     # Sort by best match score
-    results.sort(key=lambda x: x.get("final_score", 0), reverse=True)
+    results.sort(key=final_score, reverse=True)
 
     return results
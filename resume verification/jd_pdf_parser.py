@@ -3,19 +3,25 @@ jd_pdf_parser.py
 FINAL CLEAN VERSION – PDF + DOCX, Skills, Responsibilities, Tech Stack, Domain, Embedding, LOCATION
 """
 
+import io
 import os
 import re
 from typing import List, Dict, Any
 
 import pdfplumber
-from pdf2image import convert_from_path
-import pytesseract
+from pdf2image import convert_from_bytes, convert_from_path
 from docx import Document
 
+# Shared with the certificate pipeline (one module, in "certificate verification")
+from cert_path import add_cert_dir
+add_cert_dir()
+from ocr_engine import get_engine
+
 import spacy
 import yake
 import numpy as np
 from sentence_transformers import SentenceTransformer
+from embedding_service import MicroBatcher
 
 # =====================================================================
 #  LOAD MODELS (small + fast)
@@ -23,6 +29,9 @@ from sentence_transformers import SentenceTransformer
 
 embed_model = SentenceTransformer("paraphrase-MiniLM-L3-v2")
 
+# Concurrent encode calls (sessions, search jobs, API requests) share batches
+embedder = MicroBatcher(embed_model)
+
 try:
     nlp = spacy.load("en_core_web_sm")
 except:
@@ -33,12 +42,47 @@ yake_extractor = yake.KeywordExtractor(lan="en", n=2, top=20)
 
 # =====================================================================
 #  EXTRACT TEXT (PDF + DOCX)
+#  Sources can be a path, bytes or a binary file-like object, so uploads
+#  and downloads are parsed straight from memory.
 # =====================================================================
 
-def extract_text_from_pdf(path: str) -> str:
+def _is_path(source) -> bool:
+    return isinstance(source, (str, os.PathLike))
+
+
+def _as_stream(source):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    return source
+
+
+def detect_file_type(source) -> str:
+    """"pdf" or "docx", from the file name if there is one, else the magic bytes."""
+    name = os.fspath(source) if _is_path(source) else getattr(source, "name", "") or ""
+    ext = os.path.splitext(name)[1].lower().lstrip(".")
+    if ext in ("pdf", "docx"):
+        return ext
+
+    if _is_path(source):
+        with open(source, "rb") as f:
+            head = f.read(5)
+    else:
+        pos = source.tell()
+        head = source.read(5)
+        source.seek(pos)
+
+    if head.startswith(b"%PDF"):
+        return "pdf"
+    if head.startswith(b"PK"):  # docx is a zip
+        return "docx"
+    raise ValueError("Unsupported file type.")
+
+
+def extract_text_from_pdf(source) -> str:
+    source = _as_stream(source)
     text = ""
     try:
-        with pdfplumber.open(path) as pdf:
+        with pdfplumber.open(source) as pdf:
             for page in pdf.pages:
                 t = page.extract_text()
                 if t:
@@ -51,17 +95,21 @@ def extract_text_from_pdf(path: str) -> str:
 
     # OCR fallback
     try:
-        images = convert_from_path(path, dpi=300)
+        if _is_path(source):
+            images = convert_from_path(source, dpi=300)
+        else:
+            source.seek(0)
+            images = convert_from_bytes(source.read(), dpi=300)
         ocr = ""
         for img in images:
-            ocr += pytesseract.image_to_string(img) + "\n"
+            ocr += get_engine().image_to_string(img) + "\n"
         return ocr
     except:
         return text
 
 
-def extract_text_from_docx(path: str) -> str:
-    doc = Document(path)
+def extract_text_from_docx(source) -> str:
+    doc = Document(_as_stream(source))
     return "\n".join([p.text for p in doc.paragraphs if p.text.strip()])
 
 
@@ -241,7 +289,7 @@ domain_vectors = embed_model.encode(list(DOMAIN_TEXTS.values()), convert_to_nump
 domain_names = list(DOMAIN_TEXTS.keys())
 
 def extract_domain(text: str) -> str:
-    v = embed_model.encode([text], convert_to_numpy=True)[0]
+    v = embedder.encode([text])[0]
     sims = np.dot(domain_vectors, v) / (np.linalg.norm(domain_vectors, axis=1)*np.linalg.norm(v) + 1e-9)
     idx = int(np.argmax(sims))
     return domain_names[idx] if sims[idx] > 0.42 else "General"
@@ -305,21 +353,29 @@ def extract_keywords(text: str) -> List[str]:
     return [k for k, _ in yake_extractor.extract_keywords(text)][:12]
 
 def get_embedding(text: str):
-    return embed_model.encode([text])[0].tolist()
+    return embedder.encode([text])[0].tolist()
 
 
 # =====================================================================
 #  MAIN
 # =====================================================================
 
-def parse_job_description_pdf(path: str) -> Dict[str, Any]:
+def parse_job_description_pdf(source, file_type: str = None) -> Dict[str, Any]:
+    """
+    source: path, bytes or binary file-like object (e.g. a Streamlit upload).
+    file_type: "pdf" / "docx"; detected from the name or content if omitted.
+    """
+    if _is_path(source):
+        source = os.path.abspath(source)
+    else:
+        source = _as_stream(source)
 
-    path = os.path.abspath(path)
+    file_type = (file_type or detect_file_type(source)).lower()
 
-    if path.endswith(".pdf"):
-        raw = extract_text_from_pdf(path)
-    elif path.endswith(".docx"):
-        raw = extract_text_from_docx(path)
+    if file_type == "pdf":
+        raw = extract_text_from_pdf(source)
+    elif file_type == "docx":
+        raw = extract_text_from_docx(source)
     else:
         raise ValueError("Unsupported file type.")
 
@@ -0,0 +1,84 @@
+# load_test_sessions.py
+#
+# Many simultaneous "sessions" each uploading their own JD, parsed straight
+# from memory. Every JD carries a unique reference; a session fails if its
+# result contains someone else's text (what the old shared uploaded_jd.{ext}
+# file caused) or no result at all.
+#
+#   python load_test_sessions.py --sessions 50 --workers 16
+
+import argparse
+import io
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from docx import Document
+
+from jd_pdf_parser import parse_job_description_pdf
+
+JD_TEMPLATE = [
+    "Backend Engineer (reference {ref})",
+    "Location: Bangalore",
+    "Requirements",
+    "- Python, Django, REST API design and SQL",
+    "- Docker, Kubernetes and AWS deployment experience",
+    "Responsibilities",
+    "You will design and build services used by millions of customers.",
+    "You will collaborate with product teams to deploy and monitor new features.",
+]
+
+
+def make_jd(ref: str) -> bytes:
+    doc = Document()
+    for line in JD_TEMPLATE:
+        doc.add_paragraph(line.format(ref=ref))
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def run_session(i: int):
+    ref = f"REF{i:05d}"
+    data = make_jd(ref)
+
+    start = time.perf_counter()
+    try:
+        jd = parse_job_description_pdf(data, file_type="docx")
+    except Exception as e:
+        return {"session": i, "ok": False, "error": str(e), "ms": None}
+    ms = (time.perf_counter() - start) * 1000
+
+    text = jd["cleaned_text"]
+    ok = ref in text and text.count("REF") == 1
+    return {"session": i, "ok": ok, "error": None if ok else "foreign or missing JD text", "ms": ms}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Concurrent in-memory JD parsing load test")
+    ap.add_argument("--sessions", type=int, default=50)
+    ap.add_argument("--workers", type=int, default=16, help="sessions in flight at once")
+    args = ap.parse_args()
+
+    run_session(-1)  # warm-up: model load
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(run_session, range(args.sessions)))
+    elapsed = time.perf_counter() - start
+
+    failed = [r for r in results if not r["ok"]]
+    times = sorted(r["ms"] for r in results if r["ms"] is not None)
+
+    print(f"{args.sessions} sessions, {args.workers} concurrent: {elapsed:.1f}s "
+          f"({args.sessions / elapsed:.1f} JDs/s)")
+    if times:
+        p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+        print(f"latency ms  median {statistics.median(times):.0f}  p95 {p95:.0f}  max {times[-1]:.0f}")
+    print(f"failed sessions: {len(failed)}")
+    for r in failed[:10]:
+        print(f"  #{r['session']}: {r['error']}")
+
+
+if __name__ == "__main__":
+    main()
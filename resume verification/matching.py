@@ -1,7 +1,11 @@
 # matching.py
 import numpy as np
 from numpy.linalg import norm
-from jd_pdf_parser import embed_model
+from jd_pdf_parser import embedder
+from records import JDRecord, ResumeRecord, MatchRecord, intern_all
+
+# Weighted sum — you can tune
+MATCH_WEIGHTS = {"skill": 0.55, "embed": 0.30, "resp": 0.15}
 
 def cosine(a, b):
     a = np.array(a, dtype=float)
@@ -26,8 +30,7 @@ def responsibilities_similarity(jd_resps, res_resps):
         return 0.0
     jd_text = " ".join(jd_resps)
     res_text = " ".join(res_resps)
-    v1 = embed_model.encode([jd_text])[0]
-    v2 = embed_model.encode([res_text])[0]
+    v1, v2 = embedder.encode([jd_text, res_text])
     return cosine(v1, v2)
 
 def compute_match_for_resume(resume_obj: dict, jd_obj: dict, source_url: str = None):
@@ -44,8 +47,7 @@ def compute_match_for_resume(resume_obj: dict, jd_obj: dict, source_url: str = N
         s_embed = 0.0
     s_resp = responsibilities_similarity(jd_obj.get("responsibilities", []), resume_obj.get("responsibilities", []))
 
-    # Weighted sum — you can tune
-    weights = {"skill": 0.55, "embed": 0.30, "resp": 0.15}
+    weights = MATCH_WEIGHTS
     final = weights["skill"] * s_skill + weights["embed"] * s_embed + weights["resp"] * s_resp
 
     result = {
@@ -62,3 +64,30 @@ def compute_match_for_resume(resume_obj: dict, jd_obj: dict, source_url: str = N
         "cleaned_text": resume_obj.get("cleaned_text", "")
     }
     return result
+
+def compute_match_record(resume: ResumeRecord, jd: JDRecord, source_url: str = None) -> MatchRecord:
+    """
+    compute_match_for_resume() for records: same scores, but the result keeps
+    a reference to the resume instead of copies of its text and skills.
+    """
+    s_skill, matched, missing = skill_overlap_score(jd.skills, resume.skills)
+    s_embed = 0.0
+    try:
+        s_embed = cosine(jd.embedding, resume.embedding)
+    except Exception:
+        s_embed = 0.0
+    s_resp = responsibilities_similarity(list(jd.responsibilities), list(resume.responsibilities))
+
+    weights = MATCH_WEIGHTS
+    final = weights["skill"] * s_skill + weights["embed"] * s_embed + weights["resp"] * s_resp
+
+    return MatchRecord(
+        resume=resume,
+        matched_skills=intern_all(matched),
+        missing_skills=intern_all(missing),
+        skill_score=s_skill,
+        embed_score=s_embed,
+        resp_score=s_resp,
+        final_score=final,
+        source_url=source_url,
+    )
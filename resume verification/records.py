@@ -0,0 +1,163 @@
+# records.py
+#
+# Compact record types for parse and match results, for code that holds
+# many candidates at once (batch screening, the API, long search jobs).
+# Slotted dataclasses instead of dicts, embeddings as one float32 array
+# instead of a list of Python floats (~4 bytes per value instead of ~32),
+# skill strings interned, and a match holding its resume by reference rather
+# than copying text and skills. to_dict() / from_dict() convert to and from
+# the plain dicts the parsers, UI and JSON exports use.
+
+import sys
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+import numpy as np
+
+EMBEDDING_DTYPE = np.float32
+
+
+def as_embedding(values) -> np.ndarray:
+    if values is None or len(values) == 0:
+        return np.zeros(0, dtype=EMBEDDING_DTYPE)
+    return np.asarray(values, dtype=EMBEDDING_DTYPE)
+
+
+def intern_all(strings) -> Tuple[str, ...]:
+    # The same few hundred skill names recur across every candidate
+    return tuple(sys.intern(s) for s in strings or ())
+
+
+# ---------------------------------------------------------------------------
+# RECORDS
+# ---------------------------------------------------------------------------
+@dataclass(slots=True)
+class JDRecord:
+    cleaned_text: str
+    skills: Tuple[str, ...] = ()
+    responsibilities: Tuple[str, ...] = ()
+    seniority_level: str = "Not Specified"
+    tech_stack: Tuple[str, ...] = ()
+    keywords: Tuple[str, ...] = ()
+    domain: str = "General"
+    location: str = "Not Specified"
+    embedding: np.ndarray = field(default_factory=lambda: as_embedding(None))
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(
+            cleaned_text=d.get("cleaned_text", ""),
+            skills=intern_all(d.get("skills")),
+            responsibilities=tuple(d.get("responsibilities") or ()),
+            seniority_level=d.get("seniority_level", "Not Specified"),
+            tech_stack=intern_all(d.get("tech_stack")),
+            keywords=tuple(d.get("keywords") or ()),
+            domain=d.get("domain", "General"),
+            location=d.get("location", "Not Specified"),
+            embedding=as_embedding(d.get("embedding")),
+        )
+
+    def to_dict(self, include_embedding=True):
+        d = {
+            "cleaned_text": self.cleaned_text,
+            "skills": list(self.skills),
+            "responsibilities": list(self.responsibilities),
+            "seniority_level": self.seniority_level,
+            "tech_stack": list(self.tech_stack),
+            "keywords": list(self.keywords),
+            "domain": self.domain,
+            "location": self.location,
+        }
+        if include_embedding:
+            d["embedding"] = self.embedding.tolist()
+        return d
+
+
+@dataclass(slots=True)
+class ResumeRecord(JDRecord):
+    candidate_name: str = ""
+    path: str = ""
+
+    @classmethod
+    def from_dict(cls, d):
+        base = JDRecord.from_dict(d)
+        return cls(
+            **{name: getattr(base, name) for name in JDRecord.__slots__},
+            candidate_name=d.get("candidate_name", ""),
+            path=d.get("path", ""),
+        )
+
+    def to_dict(self, include_embedding=True):
+        d = JDRecord.to_dict(self, include_embedding)
+        d["candidate_name"] = self.candidate_name
+        d["path"] = self.path
+        return d
+
+
+@dataclass(slots=True)
+class MatchRecord:
+    resume: ResumeRecord
+    matched_skills: Tuple[str, ...]
+    missing_skills: Tuple[str, ...]
+    skill_score: float
+    embed_score: float
+    resp_score: float
+    final_score: float
+    source_url: Optional[str] = None
+
+    # Read through to the resume instead of storing copies
+    @property
+    def candidate_name(self):
+        return self.resume.candidate_name
+
+    @property
+    def cleaned_text(self):
+        return self.resume.cleaned_text
+
+    @property
+    def skills(self):
+        return self.resume.skills
+
+    @classmethod
+    def from_dict(cls, d, resume: ResumeRecord = None):
+        """d: compute_match_for_resume() output; resume: its record, if already built."""
+        if resume is None:
+            resume = ResumeRecord(
+                cleaned_text=d.get("cleaned_text", ""),
+                skills=intern_all(d.get("skills")),
+                candidate_name=d.get("candidate_name", ""),
+                path=d.get("path", ""),
+            )
+        return cls(
+            resume=resume,
+            matched_skills=intern_all(d.get("matched_skills")),
+            missing_skills=intern_all(d.get("missing_skills")),
+            skill_score=float(d.get("skill_score", 0.0)),
+            embed_score=float(d.get("embed_score", 0.0)),
+            resp_score=float(d.get("resp_score", 0.0)),
+            final_score=float(d.get("final_score", 0.0)),
+            source_url=d.get("source_url"),
+        )
+
+    def to_dict(self):
+        """Same shape as compute_match_for_resume(), for the UI and exports."""
+        return {
+            "candidate_name": self.candidate_name,
+            "path": self.resume.path,
+            "skills": list(self.skills),
+            "matched_skills": list(self.matched_skills),
+            "missing_skills": list(self.missing_skills),
+            "skill_score": self.skill_score,
+            "embed_score": self.embed_score,
+            "resp_score": self.resp_score,
+            "final_score": self.final_score,
+            "source_url": self.source_url,
+            "cleaned_text": self.cleaned_text,
+        }
+
+
+def final_score(result):
+    """Sort key for match results, whether MatchRecords or plain dicts."""
+    if isinstance(result, MatchRecord):
+        return result.final_score
+    return result.get("final_score", 0)
@@ -0,0 +1,111 @@
+# results_export.py
+#
+# Export of result lists as JSONL (one record per line, written
+# incrementally) or Parquet (columnar, via pyarrow). Heavy fields such as
+# full resume text and embeddings are left out unless asked for.
+# render_export() builds the file only when the user clicks "Prepare
+# download", instead of serializing everything on every rerun.
+
+import io
+import json
+
+import streamlit as st
+
+# Large per-record fields nobody needs in a shortlist export by default
+# (dropped at any depth, e.g. the README under a GitHub repo's "meta")
+HEAVY_FIELDS = ("cleaned_text", "raw_text", "embedding", "readme")
+
+FORMATS = {
+    "JSONL": ("jsonl", "application/x-ndjson"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+
+def slim(record, include_heavy=False):
+    if hasattr(record, "to_dict"):  # records.MatchRecord etc.
+        record = record.to_dict()
+    if include_heavy:
+        return record
+    return _strip_heavy(record)
+
+
+def _strip_heavy(value):
+    if isinstance(value, dict):
+        return {k: _strip_heavy(v) for k, v in value.items() if k not in HEAVY_FIELDS}
+    if isinstance(value, list):
+        return [_strip_heavy(v) for v in value]
+    return value
+
+
+# ---------------------------------------------------------------------------
+# WRITERS
+# ---------------------------------------------------------------------------
+def write_jsonl(records, fp, include_heavy=False):
+    """Write one JSON object per line to a binary file object."""
+    for r in records:
+        fp.write(json.dumps(slim(r, include_heavy), default=str).encode("utf-8"))
+        fp.write(b"\n")
+
+
+def write_parquet(records, fp, include_heavy=False):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow)")
+
+    rows = [slim(r, include_heavy) for r in records]
+
+    # from_pylist takes its columns from the first row only; give every row
+    # the union of keys (first-seen order) so later-only fields are kept
+    columns = list(dict.fromkeys(k for row in rows for k in row))
+    table = pa.Table.from_pylist([{k: row.get(k) for k in columns} for row in rows])
+    pq.write_table(table, fp, compression="zstd")
+
+
+def export_bytes(records, fmt="JSONL", include_heavy=False):
+    buf = io.BytesIO()
+    if fmt == "Parquet":
+        write_parquet(records, buf, include_heavy)
+    else:
+        write_jsonl(records, buf, include_heavy)
+    return buf.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# STREAMLIT
+# ---------------------------------------------------------------------------
+def render_export(records, key, file_stem):
+    """
+    Format / heavy-field options and a "Prepare download" button. The file
+    is built once, on click, and kept until the options or the records change.
+    """
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        fmt = st.selectbox("Export format", list(FORMATS), key=f"{key}_format")
+    with col2:
+        include_heavy = st.checkbox("Include full text and embeddings", False, key=f"{key}_heavy")
+
+    # Same records in the same order (results are only ever appended/re-sorted)
+    signature = (fmt, include_heavy, tuple(id(r) for r in records))
+    state_key = f"{key}_export"
+
+    with col3:
+        if st.button("Prepare download", key=f"{key}_prepare", use_container_width=True):
+            st.session_state[state_key] = {
+                "signature": signature,
+                "data": export_bytes(records, fmt, include_heavy),
+            }
+
+    prepared = st.session_state.get(state_key)
+    if prepared and prepared["signature"] == signature:
+        ext, mime = FORMATS[fmt]
+        st.download_button(
+            f"Download {len(records)} results ({fmt}, {len(prepared['data']) / 1024:.0f} KB)",
+            prepared["data"],
+            f"{file_stem}.{ext}",
+            mime=mime,
+            on_click="ignore",
+            key=f"{key}_download",
+            use_container_width=True,
+        )
@@ -0,0 +1,130 @@
+# results_view.py
+#
+# Candidate result rendering for app.py. All candidates go into one compact
+# score table; full cards are drawn only for the visible page, each as a
+# single HTML block (skill tags included) instead of one st.markdown call
+# per tag. Uses the CSS classes defined in app.py.
+
+import html
+import math
+
+import streamlit as st
+
+PAGE_SIZE = 10
+
+
+# ---------------------------------------------------------------------------
+# HTML PIECES
+# ---------------------------------------------------------------------------
+def skill_tags_html(skills, css_class="skill-tag"):
+    return "".join(f'<span class="{css_class}">{html.escape(str(s))}</span>' for s in skills)
+
+
+def _two_columns_html(left_title, left_html, right_title, right_html):
+    return (
+        '<div style="display: flex; gap: 1rem; margin-top: 0.5rem;">'
+        f'<div style="flex: 1;"><em>{left_title}</em><br>{left_html}</div>'
+        f'<div style="flex: 1;"><em>{right_title}</em><br>{right_html}</div>'
+        '</div>'
+    )
+
+
+def _card_header_html(title, badge, subtitle=None):
+    sub = f'<br><span>{html.escape(subtitle)}</span>' if subtitle else ""
+    return (
+        '<div style="display: flex; justify-content: space-between; align-items: center;">'
+        f'<div><strong>{html.escape(title or "")}</strong>{sub}</div>'
+        f'<div class="score-badge">{badge}</div>'
+        '</div>'
+    )
+
+
+def resume_card_html(r):
+    return (
+        '<div class="candidate-card">'
+        + _card_header_html(r["candidate_name"], f'Match Score: {r["final_score"]:.1%}')
+        + f'<a href="{html.escape(r["source_url"] or "", quote=True)}" target="_blank">View Source</a>'
+        + _two_columns_html(
+            "Matched Skills", skill_tags_html(r["matched_skills"]),
+            "Missing Skills", skill_tags_html(r["missing_skills"], "missing-skill-tag"),
+        )
+        + '</div>'
+    )
+
+
+def linkedin_card_html(c):
+    return (
+        '<div class="candidate-card">'
+        + _card_header_html(c["name"], f'Match: {c["match_score"]}%', c.get("headline"))
+        + f'<a href="{html.escape(c["url"] or "", quote=True)}" target="_blank">View LinkedIn Profile</a>'
+        + f'<div style="margin-top: 0.5rem;"><em>Skills</em><br>{skill_tags_html(c["skills"])}</div>'
+        + _two_columns_html(
+            "Matched Skills", skill_tags_html(c["matched_skills"]),
+            "Missing Skills", skill_tags_html(c["missing_skills"], "missing-skill-tag"),
+        )
+        + '</div>'
+    )
+
+
+# ---------------------------------------------------------------------------
+# PAGINATION
+# ---------------------------------------------------------------------------
+def paginate(items, key, page_size=PAGE_SIZE):
+    """The slice of items on the current page, with a page picker when needed."""
+    pages = max(1, math.ceil(len(items) / page_size))
+    page = 1
+    if pages > 1:
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            page = st.number_input("Page", 1, pages, 1, key=f"{key}_page")
+        start = (page - 1) * page_size
+        with col2:
+            st.caption(f"Showing {start + 1}-{min(start + page_size, len(items))} of {len(items)} candidates")
+    start = (page - 1) * page_size
+    return items[start:start + page_size]
+
+
+# ---------------------------------------------------------------------------
+# VIEWS
+# ---------------------------------------------------------------------------
+def render_resume_results(results, show_text, key="resume"):
+    st.dataframe(
+        [
+            {
+                "Rank": i,
+                "Candidate": r["candidate_name"],
+                "Match %": round(r["final_score"] * 100, 1),
+                "Matched": len(r["matched_skills"]),
+                "Missing": len(r["missing_skills"]),
+            }
+            for i, r in enumerate(results, start=1)
+        ],
+        hide_index=True,
+        use_container_width=True,
+    )
+
+    for r in paginate(results, key):
+        st.markdown(resume_card_html(r), unsafe_allow_html=True)
+        if show_text:
+            with st.expander("View Full Resume"):
+                st.text(r["cleaned_text"])
+
+
+def render_linkedin_results(results, key="linkedin"):
+    st.dataframe(
+        [
+            {
+                "Rank": i,
+                "Name": c["name"],
+                "Match %": c["match_score"],
+                "Matched": len(c["matched_skills"]),
+                "Missing": len(c["missing_skills"]),
+            }
+            for i, c in enumerate(results, start=1)
+        ],
+        hide_index=True,
+        use_container_width=True,
+    )
+
+    for c in paginate(results, key):
+        st.markdown(linkedin_card_html(c), unsafe_allow_html=True)
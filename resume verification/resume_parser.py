@@ -1,8 +1,15 @@
 # resume_parser.py
+import os
+from pathlib import Path
+
 from jd_pdf_parser import parse_job_description_pdf
 
-def parse_resume_file(path: str):
+def parse_resume_file(source, name: str = None):
     """
+    source: path, bytes or binary file-like object.
+    name: file name, used for type detection and as the fallback
+    candidate name (defaults to the path or source.name).
+
     Returns a standardized resume dict with keys:
     - candidate_name
     - skills (list)
@@ -12,7 +19,13 @@ def parse_resume_file(path: str):
     - embedding (list)
     - cleaned_text
     """
-    out = parse_job_description_pdf(path)
+    if isinstance(source, (str, os.PathLike)):
+        name = name or os.fspath(source)
+    else:
+        name = name or getattr(source, "name", None) or "resume"
+
+    file_type = Path(name).suffix.lower().lstrip(".")
+    out = parse_job_description_pdf(source, file_type if file_type in ("pdf", "docx") else None)
 
     # Simple name heuristic: first non-empty line or first sentence
     cleaned = out.get("cleaned_text", "")
@@ -21,5 +34,5 @@ def parse_resume_file(path: str):
         # take first line before a newline or first sentence
         name_guess = cleaned.strip().split("\n")[0].split(".")[0][:80].strip()
 
-    out["candidate_name"] = name_guess or Path(path).stem
+    out["candidate_name"] = name_guess or Path(name).stem
     return out
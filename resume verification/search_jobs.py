@@ -0,0 +1,128 @@
+# search_jobs.py
+
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from records import final_score
+
+# Concurrent searches per server process (each is mostly network wait)
+MAX_JOBS = int(os.getenv("SEARCH_JOB_WORKERS", "2"))
+
+# Finished jobs are forgotten after this many seconds
+JOB_TTL = int(os.getenv("SEARCH_JOB_TTL", "3600"))
+
+QUEUED, RUNNING, DONE, CANCELLED, FAILED = "queued", "running", "done", "cancelled", "failed"
+
+
+# ---------------------------------------------------------------------------
+# JOB
+# ---------------------------------------------------------------------------
+class SearchJob:
+    """
+    State of one background search. Written by the worker thread, read by
+    the UI on every refresh; all access goes through the lock.
+    """
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex[:12]
+        self.status = QUEUED
+        self.stage = "Queued"
+        self.done = 0
+        self.total = 0
+        self.error = None
+        self.created = time.time()
+        self.finished = None
+        self.cancel_event = threading.Event()
+        self._results = []
+        self._lock = threading.Lock()
+
+    # Callbacks handed to the search ------------------------------------
+    def set_progress(self, stage, done=0, total=0):
+        with self._lock:
+            self.stage, self.done, self.total = stage, done, total
+
+    def add_result(self, result):
+        with self._lock:
+            self._results.append(result)
+
+    # Read side ---------------------------------------------------------
+    @property
+    def finished_running(self):
+        return self.status in (DONE, CANCELLED, FAILED)
+
+    def results(self):
+        """Snapshot of the results so far, best match first."""
+        with self._lock:
+            out = list(self._results)
+        out.sort(key=final_score, reverse=True)
+        return out
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "id": self.id,
+                "status": self.status,
+                "stage": self.stage,
+                "done": self.done,
+                "total": self.total,
+                "results": len(self._results),
+                "error": self.error,
+            }
+
+    def cancel(self):
+        self.cancel_event.set()
+
+
+# ---------------------------------------------------------------------------
+# MANAGER
+# ---------------------------------------------------------------------------
+class JobManager:
+    def __init__(self, max_workers=MAX_JOBS):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="search-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Run fn(job, *args, **kwargs) in the background; returns the job
+        straight away. fn reports through job.set_progress / job.add_result
+        and should stop early once job.cancel_event is set.
+        """
+        job = SearchJob()
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        self._pool.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job:
+            job.cancel()
+        return job
+
+    def _run(self, job, fn, args, kwargs):
+        if job.cancel_event.is_set():
+            job.status = CANCELLED
+        else:
+            job.status = RUNNING
+            try:
+                fn(job, *args, **kwargs)
+                job.status = CANCELLED if job.cancel_event.is_set() else DONE
+            except Exception as e:
+                print(f"[Search Job {job.id}] {e}")
+                job.error = str(e)
+                job.status = FAILED
+        job.finished = time.time()
+
+    def _prune(self):
+        cutoff = time.time() - JOB_TTL
+        for job_id in [j.id for j in self._jobs.values() if j.finished and j.finished < cutoff]:
+            del self._jobs[job_id]